@@ -4,6 +4,7 @@ import numpy as np
 
 from algorithms.HGS.classic.ClassicHGS import ClassicHGS
 from algorithms.HGS.distributed.DistributedHGS import DistributedHGS
+from algorithms.HGS.tools import DEFAULT_ARCHIVE_CAPACITY
 from algorithms.base.driver import ComplexDriver
 
 EPSILON = np.finfo(float).eps
@@ -34,6 +35,7 @@ class HGS(ComplexDriver):
         comparison_multipliers=(1.0, 0.1, 0.01),
         population_sizes=(64, 16, 4),
         hgs_type="classic",
+        fitness_archive_capacity=DEFAULT_ARCHIVE_CAPACITY,
         *args,
         **kwargs,
     ):
@@ -43,6 +45,7 @@ class HGS(ComplexDriver):
             algorithm = DistributedHGS
         else:
             algorithm = ClassicHGS
+            kwargs["fitness_archive_capacity"] = fitness_archive_capacity
 
         self.hgs = algorithm(
             population,
@@ -74,6 +77,9 @@ class HGS(ComplexDriver):
     def finalized_population(self):
         return self.hgs.finalized_population()
 
+    def fitness_archive_stats(self):
+        return self.hgs.fitness_archive_stats()
+
     def step(self):
         self.hgs.step()
         self.cost = self.hgs.cost
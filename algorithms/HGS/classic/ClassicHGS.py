@@ -1,9 +1,7 @@
-import collections
 import math
 import random
 import time
 
-import floatextras
 import numpy as np
 import rx
 import rx.operators as ops
@@ -13,6 +11,12 @@ from rx.scheduler import NewThreadScheduler
 from algorithms.base import drivertools
 from algorithms.base.driver import StepsRun, ComplexDriver
 from algorithms.base.hv import HyperVolume
+from algorithms.HGS.tools import (
+    DEFAULT_ARCHIVE_CAPACITY,
+    ResultArchive,
+    trim_mantissa,
+    trim_vector,
+)
 
 EPSILON = np.finfo(float).eps
 
@@ -40,6 +44,7 @@ class ClassicHGS(ComplexDriver):
         comparison_multipliers=(1.0, 0.1, 0.01),
         population_sizes=(64, 16, 4),
         *args,
+        fitness_archive_capacity=DEFAULT_ARCHIVE_CAPACITY,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
@@ -71,7 +76,10 @@ class ClassicHGS(ComplexDriver):
         self.population_sizes = population_sizes
 
         self.mantissa_bits = mantissa_bits
-        self.global_fitness_archive = [ResultArchive() for _ in range(3)]
+        self.global_fitness_archive = [
+            ResultArchive(capacity=fitness_archive_capacity, bits_no=bits_no)
+            for bits_no in mantissa_bits
+        ]
 
         # TODO add preconditions checking if message adapter is HGS message adapter
 
@@ -83,6 +91,10 @@ class ClassicHGS(ComplexDriver):
 
         self.cost = 0
 
+    def fitness_archive_stats(self) -> "[dict]":
+        """ :return: Size and hit / miss / eviction counters of every level archive. """
+        return [archive.stats() for archive in self.global_fitness_archive]
+
     def finalized_population(self):
         merged_population = []
         for node in self.nodes:
@@ -364,48 +376,6 @@ def redundant(pop_a, pop_b, min_dist):
     return dist < min_dist
 
 
-def trim_vector(vector, bits_no):
-    return [trim_mantissa(x, bits_no) for x in vector]
-
-
-def trim_mantissa(value, bits_no):
-    sign, digits, exponent = floatextras.as_tuple(value)
-    digits = tuple([(d if i < bits_no else 0) for i, d in enumerate(digits)])
-    return floatextras.from_tuple((sign, digits, exponent))
-
-
-class TransformedDict(collections.MutableMapping):
-    """A dictionary that applies an arbitrary key-altering
-       function before accessing the keys"""
-
-    def __init__(self, *args, **kwargs):
-        self.store = dict()
-        self.update(dict(*args, **kwargs))  # use the free update to set keys
-
-    def __getitem__(self, key):
-        return self.store[self.__keytransform__(key)]
-
-    def __setitem__(self, key, value):
-        self.store[self.__keytransform__(key)] = value
-
-    def __delitem__(self, key):
-        del self.store[self.__keytransform__(key)]
-
-    def __iter__(self):
-        return iter(self.store)
-
-    def __len__(self):
-        return len(self.store)
-
-    def __keytransform__(self, key):
-        return key
-
-
-class ResultArchive(TransformedDict):
-    def __keytransform__(self, key):
-        return tuple(key)
-
-
 import matplotlib.pyplot as plt
 
 
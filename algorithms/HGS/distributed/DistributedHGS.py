@@ -79,7 +79,7 @@ class DistributedHGS(ComplexDriver):
 
         # TODO this is shared variable which is a problem in actor model
         self.hgs_config.global_fitness_archive = [
-            tools.ResultArchive() for _ in range(3)
+            tools.ResultArchive(bits_no=bits_no) for bits_no in mantissa_bits
         ]
 
         # TODO add preconditions checking if message adapter is HGS message adapter
@@ -96,6 +96,9 @@ class DistributedHGS(ComplexDriver):
         )
         self.cost = 0
 
+    def fitness_archive_stats(self):
+        return [archive.stats() for archive in self.hgs_config.global_fitness_archive]
+
     def shutdown(self):
         self.hgs_system.tell(self.node_supervisor, ActorExitRequest())
 
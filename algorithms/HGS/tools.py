@@ -1,8 +1,8 @@
-import collections
+import collections.abc
+import math
 import random
 import time
 
-import floatextras
 import numpy as np
 
 from algorithms.base import drivertools
@@ -23,21 +23,43 @@ def redundant(pop_a, pop_b, min_dist):
     return dist < min_dist
 
 
+MANTISSA_BITS = np.finfo(np.float64).nmant
+
+
+def trim_array(xs, bits_no) -> np.ndarray:
+    """
+    :param xs: Array of float64 values.
+    :param bits_no: Number of the leading stored mantissa bits to keep.
+    :return: Copy of `xs` with the remaining mantissa bits cleared, i.e. the values
+        rounded towards zero to the precision of the HGS level.
+    """
+    xs = np.array(xs, dtype=np.float64)
+    if bits_no >= MANTISSA_BITS:
+        return xs
+    cleared = MANTISSA_BITS - max(bits_no, 0)
+    mask = np.uint64(~((1 << cleared) - 1) & 0xFFFFFFFFFFFFFFFF)
+    bits = xs.view(np.uint64)
+    bits &= mask
+    return xs
+
+
 def trim_vector(vector, bits_no):
-    return [trim_mantissa(x, bits_no) for x in vector]
+    if bits_no >= MANTISSA_BITS:
+        return [float(x) for x in vector]
+    return trim_array(vector, bits_no).tolist()
 
 
 def trim_mantissa(value, bits_no):
-    sign, digits, exponent = floatextras.as_tuple(value)
-    digits = tuple([(d if i < bits_no else 0) for i, d in enumerate(digits)])
-    return floatextras.from_tuple((sign, digits, exponent))
+    if bits_no >= MANTISSA_BITS:
+        return float(value)
+    return float(trim_array(value, bits_no))
 
 
 def blurred_fitnesses(level, fitnesses, fitness_errors):
     def blurred(f):
         def blurred_f(*args, **kwargs):
             f_val = f(*args, **kwargs)
-            x = np.math.fabs(
+            x = math.fabs(
                 random.gauss(f_val, fitness_errors[level] * f_val / 3.0)
             )
 
@@ -49,7 +71,7 @@ def blurred_fitnesses(level, fitnesses, fitness_errors):
     return [blurred(f) for f in fitnesses]
 
 
-class TransformedDict(collections.MutableMapping):
+class TransformedDict(collections.abc.MutableMapping):
     """A dictionary that applies an arbitrary key-altering
        function before accessing the keys"""
 
@@ -76,9 +98,87 @@ class TransformedDict(collections.MutableMapping):
         return key
 
 
+# Entries kept by a single level archive; about 100 MB for 30-dimensional vectors.
+DEFAULT_ARCHIVE_CAPACITY = 2 ** 18
+
+
 class ResultArchive(TransformedDict):
+    """
+    Bounded evaluation cache of an HGS level: decision vector -> objectives.
+
+    Keys are the float64 bytes of the vector trimmed to `bits_no` mantissa bits, so
+    vectors equal at the precision of the level share one entry. Above `capacity`
+    entries (None for no limit) the least recently used entry is evicted. Membership
+    tests and `lookup` update the hit and miss counters.
+    """
+
+    def __init__(
+        self, *args, capacity=DEFAULT_ARCHIVE_CAPACITY, bits_no=MANTISSA_BITS, **kwargs
+    ):
+        self.capacity = capacity
+        self.bits_no = bits_no
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.store = collections.OrderedDict()
+        self.update(dict(*args, **kwargs))
+
     def __keytransform__(self, key):
-        return tuple(key)
+        return self._keys([key])[0]
+
+    def _keys(self, vectors):
+        vectors = list(vectors)
+        if not vectors:
+            return []
+        matrix = np.asarray(vectors, dtype=np.float64).reshape(len(vectors), -1)
+        # +0.0 turns -0.0 into 0.0, which compares equal as a tuple element
+        matrix = trim_array(matrix, self.bits_no) + 0.0
+        return [row.tobytes() for row in matrix]
+
+    def __getitem__(self, key):
+        key = self.__keytransform__(key)
+        value = self.store[key]
+        self.store.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        key = self.__keytransform__(key)
+        self.store[key] = value
+        self.store.move_to_end(key)
+        while self.capacity is not None and len(self.store) > self.capacity:
+            self.store.popitem(last=False)
+            self.evictions += 1
+
+    def __contains__(self, key):
+        return bool(self.lookup([key])[0][0])
+
+    def __iter__(self):
+        return (tuple(np.frombuffer(key).tolist()) for key in list(self.store))
+
+    def lookup(self, vectors) -> "(np.ndarray, [Any])":
+        """
+        :param vectors: Whole batch of decision vectors, e.g. the offspring.
+        :return: (hit mask, archived objectives or None for every vector).
+        """
+        values = []
+        for key in self._keys(vectors):
+            value = self.store.get(key)
+            if value is not None:
+                self.store.move_to_end(key)
+            values.append(value)
+        hits = np.array([value is not None for value in values], dtype=bool)
+        self.hits += int(hits.sum())
+        self.misses += len(hits) - int(hits.sum())
+        return hits, values
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.store),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
 
 import matplotlib.pyplot as plt
@@ -1,10 +1,17 @@
-import itertools
-import math
 import random
 import sys
 
+import numpy
+
 from algorithms.base.driver import Driver
-from algorithms.base.drivertools import rank, mutate, crossover
+from algorithms.base.drivertools import (
+    archived_objectives,
+    crossover_batch,
+    evaluate_vectors,
+    make_rng,
+    mutate_batch,
+    rank,
+)
 
 
 class IBEA(Driver):
@@ -21,6 +28,7 @@ class IBEA(Driver):
         crossover_rate,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -39,16 +47,18 @@ class IBEA(Driver):
         self.cost = 0
         self.objectives = fitnesses
         self.indicator = self.EPlusIndicator(self)
+        self.scale = None
         self.generation_counter = 0
         self.k = kappa
         self.mating_size_c = mating_population_size
         self.trim_function = trim_function
+        self.evaluate_batch = evaluate_batch
+        self.fitness_archive = fitness_archive
+        self.rng = make_rng()
         self.population = [self.trim_function(x) for x in population]
 
         self._scale_objectives()
 
-        self.fitness_archive = fitness_archive
-
     def finalized_population(self):
         return self.finish()
 
@@ -74,67 +84,63 @@ class IBEA(Driver):
         self.generation_counter += 1
 
     def _scale_objectives(self):
-        min_max = lambda x: (min(x), max(x))
-        for ind in self.individuals:
-            if not ind.known_objectives or not (
-                (self.fitness_archive is not None) and (ind.v in self.fitness_archive)
-            ):
+        cached, _ = archived_objectives(
+            self.fitness_archive, [ind.v for ind in self.individuals]
+        )
+        for ind, hit in zip(self.individuals, cached):
+            if not ind.known_objectives or not hit:
                 self.cost += 1
             ind.known_objectives = True
-        measured = [
-            (objective, min_max([objective(ind.v) for ind in self.individuals]))
-            for objective in self.objectives
-        ]
-        self.scaled_objectives = [
-            self._scale(objective, min_o, max_o)
-            for objective, (min_o, max_o) in measured
-        ]
-
-    @staticmethod
-    def _scale(fun, min_o, max_o):
-        def scaled(x):
-            return (fun(x) - min_o) / (max_o - min_o + sys.float_info.epsilon)
-
-        return scaled
+        self._cache_objectives(self.individuals)
+        objectives = self._objectives_matrix()
+        self.scale = (objectives.min(axis=0), objectives.max(axis=0))
+
+    def _cache_objectives(self, individuals):
+        missing = [ind for ind in individuals if ind.objectives is None]
+        for ind, objectives in zip(
+            missing,
+            evaluate_vectors(
+                [ind.v for ind in missing], self.objectives, self.evaluate_batch
+            ),
+        ):
+            ind.objectives = objectives
+
+    def _objectives_matrix(self):
+        return numpy.array([ind.objectives for ind in self.individuals], dtype=float)
+
+    def _scaled_objectives_matrix(self):
+        min_o, max_o = self.scale
+        return (self._objectives_matrix() - min_o) / (
+            max_o - min_o + sys.float_info.epsilon
+        )
 
     def _calculate_fitness(self):
-        self.indicators = {
-            (x1, x2): self.indicator(x1.v, x2.v)
-            for x1, x2 in itertools.product(self.individuals, self.individuals)
-        }
-        self.c = max([abs(x) for x in self.indicators.values()])
-        self.fitness = {
-            x1: sum(
-                [
-                    (-1)
-                    * math.exp(
-                        (-1)
-                        * (
-                            self.indicators[(x2, x1)]
-                            / abs(self.c * self.k + sys.float_info.epsilon)
-                        )
-                    )
-                    for x2 in self.individuals
-                    if x2 != x1
-                ]
-            )
-            for x1 in self.individuals
-        }
+        self._cache_objectives(self.individuals)
+        self.indicators = self.indicator(self._scaled_objectives_matrix())
+        self.c = numpy.abs(self.indicators).max()
+        contributions = -numpy.exp(-self.indicators / self._fitness_divisor())
+        numpy.fill_diagonal(contributions, 0.0)
+        self.fitness = dict(zip(self.individuals, contributions.sum(axis=0)))
+
+    def _fitness_divisor(self):
+        return abs(self.c * self.k + sys.float_info.epsilon)
 
     def _environmental_selection(self):
-        while len(self.individuals) > self.population_size:
-            self.individuals = sorted(
-                self.individuals, key=lambda y: self.fitness[y], reverse=True
-            )
-            removed = self.individuals.pop()
-            for x in self.individuals:
-                self.fitness[x] += math.exp(
-                    (-1)
-                    * (
-                        self.indicators[(removed, x)]
-                        / abs(self.c * self.k + sys.float_info.epsilon)
-                    )
-                )
+        surplus = len(self.individuals) - self.population_size
+        if surplus <= 0:
+            return
+        fitness = numpy.array([self.fitness[x] for x in self.individuals])
+        alive = numpy.ones(len(self.individuals), dtype=bool)
+        divisor = self._fitness_divisor()
+        for _ in range(surplus):
+            removed = numpy.flatnonzero(alive)[numpy.argmin(fitness[alive])]
+            alive[removed] = False
+            fitness += numpy.exp(-self.indicators[removed] / divisor)
+        survivors = numpy.flatnonzero(alive)
+        survivors = survivors[numpy.argsort(-fitness[survivors], kind="stable")]
+        self.individuals = [self.individuals[i] for i in survivors]
+        self.indicators = self.indicators[numpy.ix_(survivors, survivors)]
+        self.fitness = dict(zip(self.individuals, fitness[survivors]))
 
     def _mating_selection(self, p):
         coin = lambda: random.random() < p
@@ -149,21 +155,27 @@ class IBEA(Driver):
         ]
 
     def _crossover(self):
-        self.mating_individuals = [
-            crossover(
-                self.mating_individuals[i].v,
-                self.mating_individuals[self.mating_size + i].v,
-                self.dims,
-                self.crossover_rate,
-                self.crossover_eta,
-            )
-            for i in range(self.mating_size)
-        ]
+        pairs = range(self.mating_size)
+        self.mating_individuals = crossover_batch(
+            [ind.v for ind in self.mating_individuals],
+            pairs,
+            [self.mating_size + i for i in pairs],
+            self.dims,
+            self.crossover_rate,
+            self.crossover_eta,
+            self.rng,
+        )
 
     def _mutation(self):
         self.mating_individuals = [
-            self.Individual(mutate(x, self.dims, self.mutation_rate, self.mutation_eta))
-            for x in self.mating_individuals
+            self.Individual(x)
+            for x in mutate_batch(
+                self.mating_individuals,
+                self.dims,
+                self.mutation_rate,
+                self.mutation_eta,
+                self.rng,
+            ).tolist()
         ]
         for ind in self.mating_individuals:
             ind.known_objectives = False
@@ -183,24 +195,28 @@ class IBEA(Driver):
             return self.fitness_archive[ind.v]
         if not ind.known_objectives:
             self.cost += 1
-        return [objective(ind.v) for objective in self.objectives]
+        self._cache_objectives([ind])
+        return ind.objectives
 
     class EPlusIndicator:
         def __init__(self, population):
             self.population = population
 
-        def __call__(self, x1, x2):
-            return max(
-                [
-                    objective(x1) - objective(x2)
-                    for objective in self.population.scaled_objectives
-                ]
-            )
+        def __call__(self, scaled_objectives):
+            """
+            :param scaled_objectives: Matrix [n, m] of scaled objective vectors.
+            :return: Matrix I [n, n] with I[i, j] = max_k (f_k(x_i) - f_k(x_j)).
+            """
+            return (
+                scaled_objectives[:, numpy.newaxis, :]
+                - scaled_objectives[numpy.newaxis, :, :]
+            ).max(axis=2)
 
     class Individual:
         def __init__(self, vector):
             self.v = vector
             self.known_objectives = False
+            self.objectives = None
 
 
 if __name__ == "__main__":
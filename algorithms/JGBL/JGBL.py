@@ -19,6 +19,7 @@ class JGBL(NSGAII):
         jumping_percentage,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -33,6 +34,7 @@ class JGBL(NSGAII):
             crossover_rate,
             trim_function,
             fitness_archive,
+            evaluate_batch,
             *args,
             **kwargs
         )
@@ -1,5 +1,12 @@
 from algorithms.base.driver import Driver
-from algorithms.base.drivertools import mutate, crossover
+from algorithms.base.drivertools import (
+    archived_objectives,
+    crossover_batch,
+    evaluate_vectors,
+    make_rng,
+    mutate_batch,
+)
+from evotools import nd_sort
 
 __author__ = "Prpht"
 
@@ -8,6 +15,21 @@ import random
 import sys
 
 
+def nd_sort_individuals(individuals):
+    """
+    :return: (nsga_rank, front) -- front numbers of individuals and individuals grouped
+        by front, both numbered from 1.
+    """
+    individuals = list(individuals)
+    objectives = [list(ind.objectives.values()) for ind in individuals]
+    front = nd_sort.front_dict(individuals, objectives)
+    nsga_rank = collections.defaultdict(int)
+    for front_no, inds in front.items():
+        for ind in inds:
+            nsga_rank[ind] = front_no
+    return nsga_rank, front
+
+
 def dominates_weak(x, y):
     return all([a <= b for a, b in zip(x.objectives.values(), y.objectives.values())])
 
@@ -38,6 +60,7 @@ class NSGAII(Driver):
         crossover_rate,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -57,6 +80,8 @@ class NSGAII(Driver):
 
         self.trim_function = trim_function
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
+        self.rng = make_rng()
 
         self.population_size = 0
         self.individuals = []
@@ -99,47 +124,35 @@ class NSGAII(Driver):
         self.generation_counter += 1
 
     def _calculate_objectives(self):
-        for ind in self.individuals:
-            if ind.objectives is None:
-                if (self.fitness_archive is not None) and (
-                    ind.v in self.fitness_archive
-                ):
-                    fitnesses = self.fitness_archive[ind.v]
-                else:
-                    self.cost += 1
-                    fitnesses = [objective(ind.v) for objective in self.objectives]
-                    if self.fitness_archive is not None:
-                        self.fitness_archive[ind.v] = fitnesses
-                ind.objectives = {
-                    objective: fitness
-                    for objective, fitness in zip(self.objectives, fitnesses)
-                }
+        pending = [ind for ind in self.individuals if ind.objectives is None]
+        hits, archived = archived_objectives(
+            self.fitness_archive, [ind.v for ind in pending]
+        )
+        missing = [ind for ind, hit in zip(pending, hits) if not hit]
+        evaluated = dict(
+            zip(
+                map(id, missing),
+                evaluate_vectors(
+                    [ind.v for ind in missing], self.objectives, self.evaluate_batch
+                ),
+            )
+        )
+        for ind, fitnesses in zip(pending, archived):
+            if fitnesses is None and self.fitness_archive is not None:
+                # a duplicate evaluated earlier in this batch
+                fitnesses = self.fitness_archive.get(ind.v)
+            if fitnesses is None:
+                self.cost += 1
+                fitnesses = evaluated[id(ind)]
+                if self.fitness_archive is not None:
+                    self.fitness_archive[ind.v] = fitnesses
+            ind.objectives = {
+                objective: fitness
+                for objective, fitness in zip(self.objectives, fitnesses)
+            }
 
     def _nd_sort(self):
-        self.dominated_by = collections.defaultdict(set)
-        self.how_many_dominates = collections.defaultdict(int)
-        self.nsga_rank = collections.defaultdict(int)
-        self.front = collections.defaultdict(list)
-        for x in self.individuals:
-            for y in self.individuals:
-                if dominates(x, y):
-                    self.dominated_by[x].add(y)
-                elif dominates(y, x):
-                    self.how_many_dominates[x] += 1
-            if self.how_many_dominates[x] is 0:
-                self.nsga_rank[x] = 1
-                self.front[1].append(x)
-        front_no = 1
-        while True:
-            if len(self.front[front_no]) is 0:
-                break
-            for x in self.front[front_no]:
-                for y in self.dominated_by[x]:
-                    self.how_many_dominates[y] -= 1
-                    if self.how_many_dominates[y] is 0:
-                        self.nsga_rank[y] = front_no + 1
-                        self.front[front_no + 1].append(y)
-            front_no += 1
+        self.nsga_rank, self.front = nd_sort_individuals(self.individuals)
 
     def _crowding(self):
         self.dist = collections.defaultdict(float)
@@ -192,21 +205,27 @@ class NSGAII(Driver):
         ]
 
     def _crossover(self):
-        self.mating_individuals = [
-            crossover(
-                self.mating_individuals[i].v,
-                self.mating_individuals[self.mating_size + i].v,
-                self.dims,
-                self.crossover_rate,
-                self.crossover_eta,
-            )
-            for i in range(self.mating_size)
-        ]
+        pairs = range(self.mating_size)
+        self.mating_individuals = crossover_batch(
+            [ind.v for ind in self.mating_individuals],
+            pairs,
+            [self.mating_size + i for i in pairs],
+            self.dims,
+            self.crossover_rate,
+            self.crossover_eta,
+            self.rng,
+        )
 
     def _mutation(self):
         self.mating_individuals = [
-            Individual(mutate(x, self.dims, self.mutation_rate, self.mutation_eta))
-            for x in self.mating_individuals
+            Individual(x)
+            for x in mutate_batch(
+                self.mating_individuals,
+                self.dims,
+                self.mutation_rate,
+                self.mutation_eta,
+                self.rng,
+            ).tolist()
         ]
 
 
@@ -6,6 +6,14 @@ import numpy
 import numpy.linalg
 
 from algorithms.base.driver import Driver
+from algorithms.base.drivertools import (
+    archived_objectives,
+    evaluate_vectors,
+    make_rng,
+    polynomial_mutation_batch,
+    sbx_batch,
+)
+from evotools import nd_sort
 
 EPSILON = numpy.finfo(float).eps
 
@@ -25,12 +33,15 @@ class NSGAIII(Driver):
         theta=5,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
 
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
+        self.rng = make_rng()
         self.theta = theta
 
         self.dims = dims
@@ -92,17 +103,30 @@ class NSGAIII(Driver):
         self.population_size = len(self.individuals)
 
     def _calculate_objectives(self, individuals):
-        for ind in individuals:
-            if ind.objectives is None:
-                if (self.fitness_archive is not None) and (
-                    ind.v in self.fitness_archive
-                ):
-                    ind.objectives = self.fitness_archive[ind.v]
-                else:
-                    self.cost += 1
-                    ind.objectives = [objective(ind.v) for objective in self.objectives]
-                    if self.fitness_archive is not None:
-                        self.fitness_archive[ind.v] = ind.objectives
+        pending = [ind for ind in individuals if ind.objectives is None]
+        hits, archived = archived_objectives(
+            self.fitness_archive, [ind.v for ind in pending]
+        )
+        missing = [ind for ind, hit in zip(pending, hits) if not hit]
+        evaluated = dict(
+            zip(
+                map(id, missing),
+                evaluate_vectors(
+                    [ind.v for ind in missing], self.objectives, self.evaluate_batch
+                ),
+            )
+        )
+        for ind, objectives in zip(pending, archived):
+            if objectives is None and self.fitness_archive is not None:
+                # a duplicate evaluated earlier in this batch
+                objectives = self.fitness_archive.get(ind.v)
+            if objectives is not None:
+                ind.objectives = objectives
+            else:
+                self.cost += 1
+                ind.objectives = evaluated[id(ind)]
+                if self.fitness_archive is not None:
+                    self.fitness_archive[ind.v] = ind.objectives
 
     def update_ideal_point(self, individuals):
         self._calculate_objectives(individuals)
@@ -206,31 +230,35 @@ class NSGAIII(Driver):
         self.front = fronts
 
     def make_offspring_individuals(self):
+        pairs_no = int(self.population_size / 2)
+        parents_a = [random.choice(self.individuals) for _ in range(pairs_no)]
+        parents_b = [random.choice(self.individuals) for _ in range(pairs_no)]
+        children_a, children_b, crossed = sbx_batch(
+            [ind.v for ind in parents_a],
+            [ind.v for ind in parents_b],
+            self.dims,
+            self.crossover_rate,
+            self.eta_crossover,
+            self.rng,
+        )
+        # offspring rows interleaved as (a_0, b_0, a_1, b_1, ...)
+        children = numpy.stack([children_a, children_b], axis=1).reshape(
+            -1, self.dims_no
+        )
+        parents = [ind for pair in zip(parents_a, parents_b) for ind in pair]
+        crossed = numpy.repeat(crossed, 2)
+        children, mutated = polynomial_mutation_batch(
+            children, self.dims, self.mutation_rate, self.eta_mutation, self.rng
+        )
+
         offspring_inds = []
-        for _ in range(int(self.population_size / 2)):
-            parent_a = random.choice(self.individuals)
-            parent_b = random.choice(self.individuals)
-            child_a, child_b = simulated_binary_crossover(
-                parent_a,
-                parent_b,
-                self.dims,
-                crossover_rate=self.crossover_rate,
-                eta=self.eta_crossover,
-            )
-            polynomial_mutation(
-                child_a,
-                self.dims,
-                mutation_rate=self.mutation_rate,
-                eta=self.eta_mutation,
-            )
-            polynomial_mutation(
-                child_b,
-                self.dims,
-                mutation_rate=self.mutation_rate,
-                eta=self.eta_mutation,
-            )
-            offspring_inds.append(child_a)
-            offspring_inds.append(child_b)
+        for v, parent, was_crossed, was_mutated in zip(
+            children.tolist(), parents, crossed, mutated
+        ):
+            child = Individual(v)
+            if not was_crossed and not was_mutated:
+                child.objectives = [x for x in parent.objectives]
+            offspring_inds.append(child)
         return offspring_inds
 
     def normalize(self, individuals):
@@ -317,31 +345,13 @@ class Individual:
 
 
 def theta_non_dominated_sort(individuals):
-    dominated_by = collections.defaultdict(set)
-    how_many_dominates = collections.defaultdict(int)
-    nsga_rank = collections.defaultdict(int)
+    individuals = list(individuals)
+    ranks = nd_sort.grouped_ranks(
+        [x.cluster for x in individuals], [x.theta_fitness for x in individuals]
+    )
     front = collections.defaultdict(list)
-
-    for x in individuals:
-        for y in individuals:
-            if dominates(x, y):
-                dominated_by[x].add(y)
-            elif dominates(y, x):
-                how_many_dominates[x] += 1
-        if how_many_dominates[x] == 0:
-            nsga_rank[x] = 1
-            front[1].append(x)
-
-    front_no = 1
-    while not len(front[front_no]) == 0:
-        for x in front[front_no]:
-            for y in dominated_by[x]:
-                how_many_dominates[y] -= 1
-                if how_many_dominates[y] == 0:
-                    nsga_rank[y] = front_no + 1
-                    front[front_no + 1].append(y)
-        front_no += 1
-
+    for x, rank in zip(individuals, ranks):
+        front[rank + 1].append(x)
     return front
 
 
@@ -386,103 +396,14 @@ def scalar_rejection(ind, reference_point, reference_point_length):
     )
 
 
-def simulated_binary_crossover(parent_a, parent_b, dims, crossover_rate=1.0, eta=30.0):
-    child_a = Individual([x for x in parent_a.v])
-    child_b = Individual([x for x in parent_b.v])
-
-    if random.random() > crossover_rate:
-        child_a.objectives = [x for x in parent_a.objectives]
-        child_b.objectives = [x for x in parent_b.objectives]
-        return child_a, child_b
-
-    for i, dim in enumerate(dims):
-        if random.random() > 0.5:
-            continue
-        if math.fabs(parent_a.v[i] - parent_b.v[i]) <= EPSILON:
-            continue
-
-        y1 = min(parent_a.v[i], parent_b.v[i])
-        y2 = max(parent_a.v[i], parent_b.v[i])
-
-        lb, ub = dim
-
-        rand = random.random()
-
-        # child a
-        beta = 1.0 + (2.0 * (y1 - lb) / (y2 - y1 + EPSILON))
-        alpha = 2.0 - pow(beta, -(eta + 1.0))
-        beta_q = get_beta_q(rand, alpha, eta)
-
-        child_a.v[i] = 0.5 * ((y1 + y2) - beta_q * (y2 - y1))
-
-        # child b
-        beta = 1.0 + (2.0 * (ub - y2) / (y2 - y1 + EPSILON))
-        alpha = 2.0 - pow(beta, -(eta + 1.0))
-        beta_q = get_beta_q(rand, alpha, eta)
-
-        child_b.v[i] = 0.5 * ((y1 + y2) + beta_q * (y2 - y1))
-
-        # boundary checking
-        child_a.v[i] = min(ub, max(lb, child_a.v[i]))
-        child_b.v[i] = min(ub, max(lb, child_b.v[i]))
-
-        if random.random() > 0.5:
-            temp = child_a.v[i]
-            child_a.v[i] = child_b.v[i]
-            child_b.v[i] = temp
-
-    return child_a, child_b
-
-
-def get_beta_q(rand, alpha, eta):
-    if rand <= (1.0 / alpha):
-        beta_q = pow((rand * alpha), (1.0 / (eta + 1.0)))
-    else:
-        beta_q = pow((1.0 / (2.0 - rand * alpha)), (1.0 / (eta + 1.0)))
-    return beta_q
-
-
-def polynomial_mutation(ind, dims, mutation_rate=0.0, eta=20.0):
-    for i, dim in enumerate(dims):
-        if random.random() > mutation_rate:
-            continue
-
-        y = ind.v[i]
-        lb, ub = dim
-
-        delta1 = (y - lb) / (ub - lb + EPSILON)
-        delta2 = (ub - y) / (ub - lb + EPSILON)
-
-        mut_pow = 1.0 / (eta + 1.0)
-
-        rnd = random.random()
-
-        if rnd <= 0.5:
-            xy = 1.0 - delta1
-            val = 2.0 * rnd + (1.0 - 2.0 * rnd) * (pow(xy, (eta + 1.0)))
-            delta_q = pow(val, mut_pow) - 1.0
-        else:
-            xy = 1.0 - delta2
-            val = 2.0 * (1.0 - rnd) + 2.0 * (rnd - 0.5) * (pow(xy, (eta + 1.0)))
-            delta_q = 1.0 - (pow(val, mut_pow))
-
-        y += delta_q * (ub - lb)
-        y = min(ub, max(lb, y))
-
-        ind.v[i] = y
-        ind.objectives = None
-
-
 if __name__ == "__main__":
     sample_dims = [(-100.0, 100.0), (-100.0, 100.0)]
 
-    mutatedX = []
-    mutatedY = []
-    for _ in range(100):
-        to_mut = Individual([0.0, 0.0])
-        polynomial_mutation(to_mut, sample_dims, 0.9, 300.0)
-        mutatedX.append(to_mut.v[0])
-        mutatedY.append(to_mut.v[1])
+    mutated = polynomial_mutation_batch(
+        numpy.zeros((100, 2)), sample_dims, 0.9, 300.0, make_rng()
+    )[0]
+    mutatedX = mutated[:, 0].tolist()
+    mutatedY = mutated[:, 1].tolist()
     plt.scatter(mutatedX, mutatedY)
     plt.xlim(-100.0, 100.0)
     plt.ylim(-100.0, 100.0)
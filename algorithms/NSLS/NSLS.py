@@ -5,6 +5,7 @@ from scipy.spatial import distance
 
 from algorithms.NSGAII import NSGAII
 from algorithms.base.driver import Driver
+from algorithms.base.drivertools import archived_objectives, evaluate_vectors
 
 
 class NSLS(Driver):
@@ -21,6 +22,7 @@ class NSLS(Driver):
         fitness_archive=None,
         local_search_mu=0.5,
         local_search_sigma=0.5,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -28,6 +30,7 @@ class NSLS(Driver):
 
         self.trim_function = trim_function
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
 
         self.dims = dims
         self.dims_no = len(dims)
@@ -41,8 +44,6 @@ class NSLS(Driver):
         self.population_size = len(population)
         self.population = [self.trim_function(x) for x in population]
 
-        self.dominated_by = None
-        self.how_many_dominates = None
         self.nsga_rank = None
         self.front = None
 
@@ -61,21 +62,32 @@ class NSLS(Driver):
         return [x.v for x in self.individuals]
 
     def calculate_objectives(self, individuals):
-        for ind in individuals:
-            if ind.objectives is None:
-                if (self.fitness_archive is not None) and (
-                    ind.v in self.fitness_archive
-                ):
-                    fitnesses = self.fitness_archive[ind.v]
-                else:
-                    self.cost += 1
-                    fitnesses = [objective(ind.v) for objective in self.objectives]
-                    if self.fitness_archive is not None:
-                        self.fitness_archive[ind.v] = fitnesses
-                ind.objectives = {
-                    objective: fitness
-                    for objective, fitness in zip(self.objectives, fitnesses)
-                }
+        pending = [ind for ind in individuals if ind.objectives is None]
+        hits, archived = archived_objectives(
+            self.fitness_archive, [ind.v for ind in pending]
+        )
+        missing = [ind for ind, hit in zip(pending, hits) if not hit]
+        evaluated = dict(
+            zip(
+                map(id, missing),
+                evaluate_vectors(
+                    [ind.v for ind in missing], self.objectives, self.evaluate_batch
+                ),
+            )
+        )
+        for ind, fitnesses in zip(pending, archived):
+            if fitnesses is None and self.fitness_archive is not None:
+                # a duplicate evaluated earlier in this batch
+                fitnesses = self.fitness_archive.get(ind.v)
+            if fitnesses is None:
+                self.cost += 1
+                fitnesses = evaluated[id(ind)]
+                if self.fitness_archive is not None:
+                    self.fitness_archive[ind.v] = fitnesses
+            ind.objectives = {
+                objective: fitness
+                for objective, fitness in zip(self.objectives, fitnesses)
+            }
 
     def step(self):
         self.calculate_objectives(self.individuals)
@@ -132,32 +144,7 @@ class NSLS(Driver):
                 self.individuals.append(ind)
 
     def nd_sort(self):
-        self.dominated_by = collections.defaultdict(set)
-        self.how_many_dominates = collections.defaultdict(int)
-        self.nsga_rank = collections.defaultdict(int)
-        self.front = collections.defaultdict(list)
-
-        for x in self.individuals:
-            for y in self.individuals:
-                if NSGAII.dominates(x, y):
-                    self.dominated_by[x].add(y)
-                elif NSGAII.dominates(y, x):
-                    self.how_many_dominates[x] += 1
-            if self.how_many_dominates[x] is 0:
-                self.nsga_rank[x] = 1
-                self.front[1].append(x)
-
-        front_no = 1
-        while True:
-            if len(self.front[front_no]) is 0:
-                break
-            for x in self.front[front_no]:
-                for y in self.dominated_by[x]:
-                    self.how_many_dominates[y] -= 1
-                    if self.how_many_dominates[y] is 0:
-                        self.nsga_rank[y] = front_no + 1
-                        self.front[front_no + 1].append(y)
-            front_no += 1
+        self.nsga_rank, self.front = NSGAII.nd_sort_individuals(self.individuals)
 
     def next_generation(self):
         next_gen_individuals = []
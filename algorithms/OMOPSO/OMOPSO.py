@@ -3,6 +3,7 @@ import logging
 import random
 
 from algorithms.base.driver import Driver
+from algorithms.base.drivertools import archived_objectives, evaluate_vectors
 
 
 class OMOPSO(Driver):
@@ -21,6 +22,7 @@ class OMOPSO(Driver):
         mutation_probability=0.05,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -39,6 +41,7 @@ class OMOPSO(Driver):
         self.archive = Archive(self.ETA)
         self.leader_archive = LeaderArchive(self.leaders_size)
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
 
         self.init()
 
@@ -113,13 +116,23 @@ class OMOPSO(Driver):
                 self.archive.add(copy.deepcopy(p))
 
     def calculate_objectives(self):
+        cached, archived = archived_objectives(
+            self.fitness_archive, [p.value for p in self.individuals]
+        )
+        evaluated = iter(
+            evaluate_vectors(
+                [p.value for p, hit in zip(self.individuals, cached) if not hit],
+                self.fitnesses,
+                self.evaluate_batch,
+            )
+        )
         objectives_cost = 0
-        for p in self.individuals:
-            if (self.fitness_archive is not None) and (p.value in self.fitness_archive):
-                p.objectives = self.fitness_archive[p.value]
+        for p, hit, objectives in zip(self.individuals, cached, archived):
+            if hit:
+                p.objectives = objectives
                 objectives_cost = 0
             else:
-                p.objectives = [o(p.value) for o in self.fitnesses]
+                p.objectives = next(evaluated)
                 objectives_cost = len(self.individuals)
         return objectives_cost
 
@@ -4,6 +4,7 @@ import random
 import math
 
 from algorithms.base.driver import Driver
+from algorithms.base.drivertools import archived_objectives, evaluate_vectors
 
 
 class SMPSO(Driver):
@@ -27,6 +28,7 @@ class SMPSO(Driver):
         search_space_size,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -60,6 +62,7 @@ class SMPSO(Driver):
         self.archive = Archive(self.ETA)
         self.leader_archive = LeaderArchive(self.leaders_size)
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
 
         self.init()
 
@@ -125,13 +128,23 @@ class SMPSO(Driver):
                 self.archive.add(copy.deepcopy(i))
 
     def calculate_objectives(self):
+        cached, archived = archived_objectives(
+            self.fitness_archive, [i.value for i in self.individuals]
+        )
+        evaluated = iter(
+            evaluate_vectors(
+                [i.value for i, hit in zip(self.individuals, cached) if not hit],
+                self.fitnesses,
+                self.evaluate_batch,
+            )
+        )
         objectives_cost = 0
-        for i in self.individuals:
-            if (self.fitness_archive is not None) and (i.value in self.fitness_archive):
-                i.objectives = self.fitness_archive[i.value]
+        for i, hit, objectives in zip(self.individuals, cached, archived):
+            if hit:
+                i.objectives = objectives
                 objectives_cost = 0
             else:
-                i.objectives = [o(i.value) for o in self.fitnesses]
+                i.objectives = next(evaluated)
                 objectives_cost = len(self.individuals)
         return objectives_cost
 
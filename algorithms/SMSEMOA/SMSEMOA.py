@@ -4,9 +4,16 @@ import random
 import collections
 
 from algorithms.base.driver import Driver
-from algorithms.base.drivertools import crossover, mutate
-from algorithms.base.hv import HyperVolume
+from algorithms.base.drivertools import (
+    archived_objectives,
+    crossover_batch,
+    evaluate_vectors,
+    make_rng,
+    mutate_batch,
+)
+from algorithms.base.hv_contribution import exclusive_contributions
 from evotools import ea_utils
+from evotools import nd_sort as nd_sort_engine
 
 
 class SMSEMOA(Driver):
@@ -23,6 +30,7 @@ class SMSEMOA(Driver):
         epoch_length_multiplier=0.5,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -38,8 +46,11 @@ class SMSEMOA(Driver):
         self.population = [self.trim_function(x) for x in population]
         self.epoch_length = int(len(self.individuals) * epoch_length_multiplier)
         self.reference_point = reference_point
+        self.fronts = None
 
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
+        self.rng = make_rng()
 
         self.logger = logging.getLogger(__name__)
         self.cost = self.calculate_objectives(self.individuals)
@@ -62,79 +73,91 @@ class SMSEMOA(Driver):
             self.individuals = self.reduce_population(self.individuals + [new_indiv])
 
     def calculate_objectives(self, pop):
+        cached, archived = archived_objectives(
+            self.fitness_archive, [p.value for p in pop]
+        )
+        evaluated = iter(
+            evaluate_vectors(
+                [p.value for p, hit in zip(pop, cached) if not hit],
+                self.fitnesses,
+                self.evaluate_batch,
+            )
+        )
         objectives_cost = 0
-        for p in pop:
-            if (self.fitness_archive is not None) and (p.value in self.fitness_archive):
-                p.objectives = self.fitness_archive[p.value]
+        for p, hit, objectives in zip(pop, cached, archived):
+            if hit:
+                p.objectives = objectives
                 objectives_cost = 0
             else:
-                p.objectives = [o(p.value) for o in self.fitnesses]
+                p.objectives = next(evaluated)
                 objectives_cost = len(self.population)
         return objectives_cost
 
     def generate(self, pop):
+        # steady state: each offspring depends on the population reduced after the
+        # previous one, so the batch operators get a single pair
         selected_parents = [x.value for x in random.sample(pop, 2)]
-        child = crossover(
-            selected_parents[0],
-            selected_parents[1],
+        child = crossover_batch(
+            selected_parents,
+            [0],
+            [1],
             self.dims,
             self.crossover_rate,
             self.crossover_eta,
+            self.rng,
         )
-
-        return Individual(
-            self.trim_function(
-                mutate(child, self.dims, self.mutation_rate, self.mutation_eta)
-            )
+        child = mutate_batch(
+            child, self.dims, self.mutation_rate, self.mutation_eta, self.rng
         )
+        return Individual(self.trim_function(child[0].tolist()))
 
     def reduce_population(self, pop):
-        sorted_pop = nd_sort(pop)
-        worst_front = max(sorted_pop.items(), key=lambda x: x[0])[1]
+        fronts = self.update_fronts(pop)
+        worst_front = fronts[-1]
 
         hv_contribution = self.calculate_hypervolume_contribution(worst_front)
         min_contributor = min(hv_contribution, key=lambda x: x[1])
 
         pop.remove(min_contributor[0])
+        worst_front.remove(min_contributor[0])
+        if not worst_front:
+            fronts.pop()
         return pop
 
+    def update_fronts(self, pop):
+        """
+        Non-dominated fronts of `pop`. When `pop` is the previous population plus one
+        offspring, only the fronts from the one the offspring falls into are re-sorted.
+        """
+        known = {id(x) for front in self.fronts or [] for x in front}
+        new = [x for x in pop if id(x) not in known]
+        if not self.fronts or len(new) != 1 or len(pop) != len(known) + 1:
+            self.fronts = sort_into_fronts(pop)
+            return self.fronts
+
+        [offspring] = new
+        front_no = nd_sort_engine.insertion_front(
+            [[x.objectives for x in front] for front in self.fronts],
+            offspring.objectives,
+        )
+        tail = [x for front in self.fronts[front_no:] for x in front]
+        self.fronts[front_no:] = sort_into_fronts(tail + [offspring])
+        return self.fronts
+
     def calculate_hypervolume_contribution(self, pop):
-        hv = HyperVolume(self.reference_point)
-        results = [x.objectives for x in pop]
+        contributions = exclusive_contributions(
+            [x.objectives for x in pop], self.reference_point
+        )
+        return list(zip(pop, contributions))
 
-        hv_global = hv.compute(results)
 
-        return [
-            (pop[i], hv_global - hv.compute(results[:i] + results[i + 1 :]))
-            for i in range(len(results))
-        ]
+def sort_into_fronts(pop):
+    return nd_sort_engine.sort_into_fronts(pop, [x.objectives for x in pop])
 
 
 def nd_sort(pop):
-    dominated_by = collections.defaultdict(set)
-    how_many_dominates = collections.defaultdict(int)
-    front = collections.defaultdict(list)
-
-    for x in pop:
-        for y in pop:
-            if ea_utils.dominates(x.objectives, y.objectives):
-                dominated_by[x].add(y)
-            elif ea_utils.dominates(y.objectives, x.objectives):
-                how_many_dominates[x] += 1
-        if how_many_dominates[x] is 0:
-            front[1].append(x)
-    front_no = 1
-    while True:
-        if len(front[front_no]) is 0:
-            break
-        for x in front[front_no]:
-            for y in dominated_by[x]:
-                how_many_dominates[y] -= 1
-                if how_many_dominates[y] is 0:
-                    front[front_no + 1].append(y)
-        front_no += 1
-    del front[front_no]
-    return front
+    pop = list(pop)
+    return nd_sort_engine.front_dict(pop, [x.objectives for x in pop])
 
 
 class Individual:
@@ -7,10 +7,17 @@
 import math
 import random
 
+import numpy as np
+
 from algorithms.base.driver import Driver
-from algorithms.base.drivertools import crossover, mutate
-from evotools import ea_utils
-from metrics.metrics_utils import euclid_distance
+from algorithms.base.drivertools import (
+    archived_objectives,
+    crossover_batch,
+    evaluate_vectors,
+    make_rng,
+    mutate_batch,
+)
+from algorithms.base.population import Population
 
 
 class SPEA2(Driver):
@@ -18,9 +25,12 @@ class SPEA2(Driver):
         def __init__(self):
             self.tournament_size = 2
 
-        def __call__(self, pool):
-            sub_pool = random.sample(pool, self.tournament_size)
-            return min(sub_pool, key=lambda x: x["fitness"])["value"]
+        def __call__(self, pool: Population):
+            return pool.vector(self.index(pool))
+
+        def index(self, pool: Population) -> int:
+            sub_pool = random.sample(range(len(pool)), self.tournament_size)
+            return min(sub_pool, key=lambda i: pool.fitness[i])
 
     def __init__(
         self,
@@ -33,6 +43,7 @@ class SPEA2(Driver):
         crossover_rate,
         trim_function=lambda x: x,
         fitness_archive=None,
+        evaluate_batch=None,
         *args,
         **kwargs
     ):
@@ -48,156 +59,121 @@ class SPEA2(Driver):
         self.population = [self.trim_function(x) for x in population]
 
         self.__archive_size = len(population)
-        self.archive = []
+        self.archive = Population.from_vectors([], len(fitnesses))
         self.select = SPEA2.Tournament()
 
         self.fitness_archive = fitness_archive
+        self.evaluate_batch = evaluate_batch
+        self.rng = make_rng()
 
     @property
     def population(self):
-        return [x["value"] for x in self.individuals]
+        return self.individuals.vectors()
 
     @population.setter
     def population(self, pop):
-        self.individuals = [{"value": x} for x in pop]
+        self.individuals = Population.from_vectors(pop, len(self.fitnesses))
 
     def finalized_population(self):
-        return [x["value"] for x in self.archive]
+        return self.archive.vectors()
 
     def finish(self):
-        return [x["value"] for x in self.archive]
+        return self.archive.vectors()
 
     def step(self):
-        self.cost += self.calculate_fitnesses(self.individuals, self.archive)
-        self.archive = self.environmental_selection(self.individuals, self.archive)
-
-        self.population = [
-            self.trim_function(
-                mutate(
-                    crossover(
-                        self.select(self.archive),
-                        self.select(self.archive),
-                        self.dims,
-                        self.crossover_rate,
-                        self.crossover_eta,
-                    ),
-                    self.dims,
-                    self.mutation_rate,
-                    self.mutation_eta,
-                )
+        self.cost += self.calculate_objectives(self.individuals)
+        union = Population.concatenate(self.archive, self.individuals)
+        self.calculate_fitnesses(union)
+        self.archive = self.environmental_selection(union)
+
+        offspring_no = len(self.individuals)
+        first = [self.select.index(self.archive) for _ in range(offspring_no)]
+        second = [self.select.index(self.archive) for _ in range(offspring_no)]
+        offspring = mutate_batch(
+            crossover_batch(
+                self.archive.decisions,
+                first,
+                second,
+                self.dims,
+                self.crossover_rate,
+                self.crossover_eta,
+                self.rng,
+            ),
+            self.dims,
+            self.mutation_rate,
+            self.mutation_eta,
+            self.rng,
+        )
+        self.population = [self.trim_function(x) for x in offspring.tolist()]
+
+    def calculate_fitnesses(self, union: Population):
+        """ fitness = raw fitness (strengths of the dominators) + density. """
+        dominates = union.dominance_matrix()
+        strength = dominates.sum(axis=1)
+        raw_fitness = strength @ dominates
+
+        distances = np.sort(union.objective_distances(), axis=1)
+        k = int(math.sqrt(len(union)))
+        density = 1.0 / (distances[:, k] + 2.0)
+
+        union.fitness = raw_fitness + density
+
+    def calculate_objectives(self, pop: Population):
+        vectors = pop.vectors()
+        cached, archived = archived_objectives(self.fitness_archive, vectors)
+        evaluated = iter(
+            evaluate_vectors(
+                [v for v, hit in zip(vectors, cached) if not hit],
+                self.fitnesses,
+                self.evaluate_batch,
             )
-            for _ in self.individuals
-        ]
-
-    def calculate_fitnesses(self, population, archive):
-        objectives_cost = self.calculate_objectives(population)
-        union = archive + population
-        self.calculate_dominated(union)
-
-        for p in union:
-            raw_fitness = self.calculate_raw_fitness(p, union)
-            density = self.calculate_density(p, union)
-            p["fitness"] = raw_fitness + density
-        return objectives_cost
-
-    def calculate_raw_fitness(self, p1, pop):
-        return 0.0 + sum(y["dominates"] for y in pop if self.dominates(y, p1))
-
-    def calculate_density(self, p1, pop):
-        distances = sorted(
-            [self.euclidean_distance(p1["objectives"], p2["objectives"]) for p2 in pop]
         )
-        k = int(math.sqrt(len(pop)))
-        return 1.0 / (distances[k] + 2.0)
-
-    def calculate_objectives(self, pop):
         objectives_cost = 0
-        for p in pop:
-            if (self.fitness_archive is not None) and (
-                p["value"] in self.fitness_archive
-            ):
-                p["objectives"] = self.fitness_archive[p["value"]]
+        for i, (hit, objectives) in enumerate(zip(cached, archived)):
+            if hit:
+                pop.objectives[i] = objectives
                 objectives_cost = 0
             else:
-                p["objectives"] = [o(p["value"]) for o in self.fitnesses]
+                pop.objectives[i] = next(evaluated)
                 objectives_cost = len(self.population)
         return objectives_cost
 
-    def calculate_dominated(self, pop):
-        for p in pop:
-            p["dominates"] = len(
-                [x for x in pop if id(p) != id(x) and self.dominates(p, x)]
-            )
-
-    @staticmethod
-    def dominates(p1, p2):
-        return ea_utils.dominates(p1["objectives"], p2["objectives"])
-
-    @staticmethod
-    def euclidean_distance(c1, c2):
-        return euclid_distance(c1, c2)
-
-    def environmental_selection(self, pop, archive):
-        union = archive + pop
-        sorted_union = sorted(union, key=lambda x: x["fitness"])
-        index = self.get_domination_index(sorted_union)
-        environment = sorted_union[:index]
+    def environmental_selection(self, union: Population) -> Population:
+        order = np.argsort(union.fitness, kind="stable")
+        # the non-dominated individuals are exactly those with fitness below 1
+        index = int(np.searchsorted(union.fitness[order], 1.0, side="right"))
+        environment = list(order[:index])
 
         if len(environment) < self.__archive_size:
             diff_size = self.__archive_size - len(environment)
-            environment += sorted_union[index : index + diff_size]
+            environment += list(order[index : index + diff_size])
 
         elif len(environment) > self.__archive_size:
-            while len(environment) > self.__archive_size:
-                to_truncate = self.choose_to_truncate(environment)
-                environment.remove(to_truncate)
+            environment = np.array(environment)
+            distances = union.take(environment).objective_distances()
+            alive = np.ones(len(environment), dtype=bool)
+            while alive.sum() > self.__archive_size:
+                members = np.flatnonzero(alive)
+                sorted_distances = np.sort(distances[np.ix_(members, members)], axis=1)
+                alive[members[self.choose_to_truncate(sorted_distances)]] = False
+            environment = environment[alive]
 
-        return environment
+        return union.take(environment)
 
     @staticmethod
-    def get_domination_index(sorted_pop):
-        for i, p in enumerate(sorted_pop):
-            if p["fitness"] > 1:
-                return i
-
-        return len(sorted_pop)
-
-    def choose_to_truncate(self, pop):
-        distances = []
-        for p in pop:
-            distances.append(
-                (
-                    p,
-                    sorted(
-                        [
-                            (
-                                p2,
-                                self.euclidean_distance(
-                                    p["objectives"], p2["objectives"]
-                                ),
-                            )
-                            for p2 in pop
-                        ],
-                        key=lambda x: x[1],
-                    ),
-                )
-            )
-
-        return self.get_min(distances, 0)[0]
-
-    def get_min(self, distances, level):
-        if level >= len(distances):
-            return distances[0]
-
-        sorted_distances = sorted(distances, key=lambda dist: dist[1][level][1])
-        result = [sorted_distances[0]]
-        for d in sorted_distances[1:]:
-            if d[1][level][1] == result[0][1][level][1]:
-                result.append(d)
-            else:
+    def choose_to_truncate(sorted_distances):
+        """
+        :param sorted_distances: Row i holds the sorted distances from the i-th
+            individual to all individuals.
+        :return: Row of the individual with the lexicographically smallest distances;
+            the comparison stops after as many levels as there are tied candidates.
+        """
+        candidates = np.arange(len(sorted_distances))
+        level = 0
+        while level < len(candidates):
+            values = sorted_distances[candidates, level]
+            candidates = candidates[values == values.min()]
+            if len(candidates) == 1:
                 break
-
-        if len(result) > 1:
-            return self.get_min(result, level + 1)
-
-        return result[0]
+            level += 1
+        return candidates[0]
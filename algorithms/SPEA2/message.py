@@ -11,17 +11,7 @@ class SPEA2IMGAMessageAdapter(IMGAMessageAdapter):
         self.driver.individuals.extend(migrants)
 
     def emigrate(self, migrants: SubPopulation):
-        immigrants_cp = list(migrants)
-        to_remove = []
-
-        for p in self.driver.individuals:
-            if p["value"] in immigrants_cp:
-                to_remove.append(p)
-                immigrants_cp.remove(p["value"])
-
-        for p in to_remove:
-            self.driver.individuals.remove(p)
-        return to_remove
+        return self.driver.individuals.remove_vectors(migrants)
 
 
 class SPEA2HGSMessageAdapter(HGSMessageAdapter):
@@ -29,6 +19,6 @@ class SPEA2HGSMessageAdapter(HGSMessageAdapter):
         return self.driver.population
 
     def nominate_delegates(self):
-        return [x["value"] for x in self.driver.archive]
+        return self.driver.archive.vectors()
 
 SPEA2DHGSMessageAdapter = SPEA2HGSMessageAdapter
\ No newline at end of file
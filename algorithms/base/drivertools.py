@@ -116,6 +116,121 @@ def get_beta_q(rand, alpha, eta):
     return beta_q
 
 
+def make_rng() -> numpy.random.Generator:
+    """ :return: Generator numpy ziarnowany z `random`, więc `random.seed` ustala przebieg. """
+    return numpy.random.default_rng(random.getrandbits(64))
+
+
+def as_decisions(vectors, dims) -> numpy.ndarray:
+    """ :return: Macierz [n, len(dims)] wektorów decyzyjnych. """
+    return numpy.asarray(vectors, dtype=float).reshape(-1, len(dims))
+
+
+def _bounds(dims):
+    bounds = numpy.asarray(dims, dtype=float).reshape(-1, 2)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def polynomial_mutation_batch(xs, dims, mutation_rate, eta, rng):
+    """
+    Mutacja wielomianowa `mutate` wszystkich wierszy macierzy `xs` naraz.
+
+    :return: (macierz po mutacji, maska wierszy, w których wylosowano choć jeden gen).
+    """
+    xs = as_decisions(xs, dims)
+    lb, ub = _bounds(dims)
+    drawn = rng.random(xs.shape) <= mutation_rate
+    rnd = rng.random(xs.shape)
+
+    delta1 = (xs - lb) / (ub - lb + EPSILON)
+    delta2 = (ub - xs) / (ub - lb + EPSILON)
+    mut_pow = 1.0 / (eta + 1.0)
+
+    with numpy.errstate(all="ignore"):
+        lower = 2.0 * rnd + (1.0 - 2.0 * rnd) * numpy.power(1.0 - delta1, eta + 1.0)
+        upper = 2.0 * (1.0 - rnd) + 2.0 * (rnd - 0.5) * numpy.power(
+            1.0 - delta2, eta + 1.0
+        )
+        delta_q = numpy.where(
+            rnd <= 0.5,
+            numpy.power(lower, mut_pow) - 1.0,
+            1.0 - numpy.power(upper, mut_pow),
+        )
+
+    mutated = numpy.clip(xs + delta_q * (ub - lb), lb, ub)
+    return numpy.where(drawn, mutated, xs), drawn.any(axis=1)
+
+
+def mutate_batch(xs, dims, mutation_rate, eta, rng) -> numpy.ndarray:
+    """ :return: Macierz potomków po mutacji wielomianowej wszystkich wierszy `xs`. """
+    return polynomial_mutation_batch(xs, dims, mutation_rate, eta, rng)[0]
+
+
+def _batch_beta_q(rand, alpha, eta):
+    with numpy.errstate(all="ignore"):
+        return numpy.where(
+            rand <= 1.0 / alpha,
+            numpy.power(rand * alpha, 1.0 / (eta + 1.0)),
+            numpy.power(1.0 / (2.0 - rand * alpha), 1.0 / (eta + 1.0)),
+        )
+
+
+def sbx_batch(parents_a, parents_b, dims, crossover_rate, eta, rng):
+    """
+    Krzyżowanie SBX par wierszy (parents_a[i], parents_b[i]) naraz.
+
+    :return: (dzieci a, dzieci b, maska skrzyżowanych par). Pary nieskrzyżowane dają
+        kopie rodziców.
+    """
+    parents_a = as_decisions(parents_a, dims)
+    parents_b = as_decisions(parents_b, dims)
+    lb, ub = _bounds(dims)
+    n = len(parents_a)
+    crossed = rng.random(n) <= crossover_rate
+    genes = (
+        crossed[:, numpy.newaxis]
+        & (rng.random(parents_a.shape) <= 0.5)
+        & (numpy.abs(parents_a - parents_b) > EPSILON)
+    )
+    rand = rng.random(parents_a.shape)
+    swap = rng.random(parents_a.shape) > 0.5
+
+    y1 = numpy.minimum(parents_a, parents_b)
+    y2 = numpy.maximum(parents_a, parents_b)
+    with numpy.errstate(all="ignore"):
+        beta_a = 1.0 + (2.0 * (y1 - lb) / (y2 - y1 + EPSILON))
+        beta_b = 1.0 + (2.0 * (ub - y2) / (y2 - y1 + EPSILON))
+        alpha_a = 2.0 - numpy.power(beta_a, -(eta + 1.0))
+        alpha_b = 2.0 - numpy.power(beta_b, -(eta + 1.0))
+    child_a = 0.5 * ((y1 + y2) - _batch_beta_q(rand, alpha_a, eta) * (y2 - y1))
+    child_b = 0.5 * ((y1 + y2) + _batch_beta_q(rand, alpha_b, eta) * (y2 - y1))
+    child_a = numpy.clip(child_a, lb, ub)
+    child_b = numpy.clip(child_b, lb, ub)
+
+    children_a = numpy.where(genes, numpy.where(swap, child_b, child_a), parents_a)
+    children_b = numpy.where(genes, numpy.where(swap, child_a, child_b), parents_b)
+    return children_a, children_b, crossed
+
+
+def crossover_batch(xs, first, second, dims, crossover_rate, eta, rng):
+    """
+    `crossover` par (xs[first[i]], xs[second[i]]) liczony naraz.
+
+    :param xs: Macierz [n, d] wektorów decyzyjnych rodziców.
+    :param first: Indeksy pierwszych rodziców.
+    :param second: Indeksy drugich rodziców.
+    :return: Macierz potomków, jeden na parę (losowo jedno z dwojga dzieci).
+    """
+    xs = as_decisions(xs, dims)
+    first = numpy.asarray(first, dtype=int)
+    second = numpy.asarray(second, dtype=int)
+    children_a, children_b, _ = sbx_batch(
+        xs[first], xs[second], dims, crossover_rate, eta, rng
+    )
+    take_b = rng.random(len(first)) < 0.5
+    return numpy.where(take_b[:, numpy.newaxis], children_b, children_a)
+
+
 def old_crossover(xs, ys):
     return [random.uniform(x, y) for x, y in zip(xs, ys)]
 
@@ -143,6 +258,32 @@ def average_indiv(population):
     return list(res)
 
 
+def evaluate_vectors(vectors, fitnesses, evaluate_batch=None) -> "[[Float]]":
+    """
+    :param vectors: Lista wektorów do ocenienia.
+    :param fitnesses: Skalarne funkcje celu problemu.
+    :param evaluate_batch: Opcjonalna funkcja problemu oceniająca całą macierz [n, d]
+        jednym wywołaniem; gdy jej brak, używane są funkcje `fitnesses`.
+    :return: Lista wektorów wyników, w kolejności `vectors`.
+    """
+    if len(vectors) == 0:
+        return []
+    if evaluate_batch is None:
+        return [[f(v) for f in fitnesses] for v in vectors]
+    return numpy.asarray(evaluate_batch(numpy.asarray(vectors, dtype=float))).tolist()
+
+
+def archived_objectives(fitness_archive, vectors) -> "(numpy.ndarray, [Any])":
+    """
+    :param fitness_archive: Archiwum wyników (np. `ResultArchive` poziomu HGS) lub None.
+    :param vectors: Cała partia wektorów, np. potomstwo.
+    :return: (maska trafień, wyniki z archiwum lub None) dla każdego wektora.
+    """
+    if fitness_archive is None:
+        return numpy.zeros(len(vectors), dtype=bool), [None] * len(vectors)
+    return fitness_archive.lookup(vectors)
+
+
 def rank(individuals: "Iterator Individual", calc_objective):
     """
     :param individuals: Grupa indywiduów.
@@ -15,6 +15,8 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import bisect
+
 __author__ = "Simon Wessing"
 
 # TODO Use global hv after evil branch merge!
@@ -27,14 +29,34 @@ class HyperVolume:
 
     Minimization is implicitly assumed here!
 
+    Two- and three-dimensional fronts are computed by dedicated sweeps unless
+    the "recursive" backend is selected, either per instance or for all
+    instances through HyperVolume.backend.
+
     """
 
-    def __init__(self, referencePoint):
+    backend = "auto"
+    backends = ("auto", "recursive")
+
+    def __init__(self, referencePoint, backend=None):
         """Constructor."""
         self.referencePoint = referencePoint
         self.list = []
+        if backend is not None:
+            self.backend = backend
+        if self.backend not in self.backends:
+            raise ValueError("Unknown hypervolume backend: {}".format(self.backend))
 
     def compute(self, front):
+        """Returns the hypervolume that is dominated by a non-dominated front."""
+        if self.backend == "auto":
+            if len(self.referencePoint) == 2:
+                return hypervolume_2d(front, self.referencePoint)
+            if len(self.referencePoint) == 3:
+                return hypervolume_3d(front, self.referencePoint)
+        return self.computeRecursive(front)
+
+    def computeRecursive(self, front):
         """Returns the hypervolume that is dominated by a non-dominated front.
 
         Before the HV computation, front and reference point are translated, so
@@ -282,6 +304,63 @@ class MultiList:
                 bounds[i] = node.cargo[i]
 
 
+def relevant_points(front, referencePoint):
+    """Points of 'front' that weakly dominate the reference point, as tuples."""
+    return [
+        tuple(point)
+        for point in front
+        if all(x <= r for x, r in zip(point, referencePoint))
+    ]
+
+
+def hypervolume_2d(front, referencePoint):
+    """Exact two-dimensional hypervolume by a sort-and-sweep in O(n log n)."""
+    points = sorted(relevant_points(front, referencePoint))
+    hyperVolume = 0.0
+    bound = referencePoint[1]
+    for x, y in points:
+        if y < bound:
+            hyperVolume += (referencePoint[0] - x) * (bound - y)
+            bound = y
+    return hyperVolume
+
+
+def hypervolume_3d(front, referencePoint):
+    """Exact three-dimensional hypervolume.
+
+    Points are swept along the third objective while the area dominated in
+    the first two objectives is kept up to date in a staircase sorted by
+    the first objective, so every point is inserted and removed once.
+
+    """
+    points = sorted(relevant_points(front, referencePoint), key=lambda p: p[2])
+    refX, refY, refZ = referencePoint
+    xs, ys = [], []
+    area = 0.0
+    hyperVolume = 0.0
+    for i, (x, y, z) in enumerate(points):
+        k = bisect.bisect_right(xs, x)
+        if not (k > 0 and ys[k - 1] <= y):
+            # not dominated by the staircase: cut out what the point covers
+            left_height = refY - ys[k - 1] if k > 0 else 0.0
+            l = k
+            covered = 0.0
+            start = x
+            height = left_height
+            while l < len(xs) and ys[l] >= y:
+                covered += (xs[l] - start) * height
+                start, height = xs[l], refY - ys[l]
+                l += 1
+            end = xs[l] if l < len(xs) else refX
+            covered += (end - start) * height
+            area += (end - x) * (refY - y) - covered
+            xs[k:l] = [x]
+            ys[k:l] = [y]
+        next_z = points[i + 1][2] if i + 1 < len(points) else refZ
+        hyperVolume += area * (next_z - z)
+    return hyperVolume
+
+
 if __name__ == "__main__":
 
     # Example:
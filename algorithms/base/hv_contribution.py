@@ -0,0 +1,82 @@
+from algorithms.base.hv import (
+    HyperVolume,
+    hypervolume_3d,
+    relevant_points,
+)
+from evotools import nd_sort
+
+
+def exclusive_contributions(front, reference_point) -> "[float]":
+    """
+    :param front: Mutually non-dominated objective vectors (duplicates allowed).
+    :param reference_point: Hypervolume reference point (minimization).
+    :return: Hypervolume lost by removing each point of `front`, in input order.
+    """
+    if len(front) == 0:
+        return []
+    if len(reference_point) == 2:
+        return _contributions_2d(front, reference_point)
+    if len(reference_point) == 3:
+        return _limited_contributions(front, reference_point, hypervolume_3d)
+    return _limited_contributions(front, reference_point, _hypervolume_of_front)
+
+
+def _hypervolume_of_front(points, reference_point):
+    # the dimension-sweep expects a non-dominated front without duplicates
+    points = [list(point) for point in set(map(tuple, points))]
+    if len(points) == 0:
+        return 0.0
+    front = nd_sort.non_dominated_fronts(points)[0]
+    return HyperVolume(reference_point).compute([points[i] for i in front])
+
+
+def _box_volume(point, reference_point):
+    volume = 1.0
+    for x, r in zip(point, reference_point):
+        volume *= r - x
+    return volume
+
+
+def _is_relevant(point, reference_point):
+    return all(x <= r for x, r in zip(point, reference_point))
+
+
+def _contributions_2d(front, reference_point):
+    """ O(n log n): each point owns the rectangle between its two neighbours. """
+    points = sorted(set(relevant_points(front, reference_point)))
+    counts = {}
+    for point in front:
+        counts[tuple(point)] = counts.get(tuple(point), 0) + 1
+
+    owned = {}
+    for i, (x, y) in enumerate(points):
+        right = points[i + 1][0] if i + 1 < len(points) else reference_point[0]
+        upper = points[i - 1][1] if i > 0 else reference_point[1]
+        owned[(x, y)] = (right - x) * (upper - y)
+
+    return [
+        owned.get(tuple(point), 0.0) if counts[tuple(point)] == 1 else 0.0
+        for point in front
+    ]
+
+
+def _limited_contributions(front, reference_point, hypervolume):
+    """
+    Contribution of p is the volume of its box minus the hypervolume of the other
+    points limited to that box, i.e. max(p, q) for every other q.
+    """
+    points = [tuple(point) for point in front]
+    contributions = []
+    for i, p in enumerate(points):
+        if not _is_relevant(p, reference_point):
+            contributions.append(0.0)
+            continue
+        limited = [
+            [max(a, b) for a, b in zip(p, q)]
+            for j, q in enumerate(points)
+            if j != i and _is_relevant(q, reference_point)
+        ]
+        contributions.append(
+            _box_volume(p, reference_point) - hypervolume(limited, reference_point)
+        )
+    return contributions
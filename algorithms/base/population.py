@@ -0,0 +1,107 @@
+import numpy as np
+
+from evotools import nd_sort
+
+
+class Population:
+    """
+    Struct-of-arrays population: row i of every column describes the i-th individual.
+
+    decisions  -- matrix [n, d] of decision vectors,
+    objectives -- matrix [n, m] of objective vectors, NaN rows are not evaluated yet,
+    rank, crowding, fitness -- selection columns filled in by the driver,
+    alive      -- mask of the individuals that take part in the run.
+
+    Drivers keep a Population instead of one Python object per individual; the
+    list-of-vectors view used by `population`, `finalized_population()` and the
+    message adapters is produced by `vectors()`.
+    """
+
+    def __init__(self, decisions, objectives):
+        self.decisions = decisions
+        self.objectives = objectives
+        n = len(decisions)
+        self.rank = np.zeros(n, dtype=int)
+        self.crowding = np.zeros(n)
+        self.fitness = np.zeros(n)
+        self.alive = np.ones(n, dtype=bool)
+
+    @classmethod
+    def from_vectors(cls, vectors, objectives_no) -> "Population":
+        vectors = list(vectors)
+        decisions = np.array(vectors, dtype=float)
+        decisions = decisions.reshape(len(vectors), -1 if vectors else 0)
+        objectives = np.full((len(vectors), objectives_no), np.nan)
+        return cls(decisions, objectives)
+
+    @classmethod
+    def concatenate(cls, *populations) -> "Population":
+        populations = [p for p in populations if len(p)] or populations[:1]
+        result = cls(
+            np.concatenate([p.decisions for p in populations]),
+            np.concatenate([p.objectives for p in populations]),
+        )
+        for column in ("rank", "crowding", "fitness", "alive"):
+            columns = [getattr(p, column) for p in populations]
+            setattr(result, column, np.concatenate(columns))
+        return result
+
+    def __len__(self):
+        return len(self.decisions)
+
+    @property
+    def objectives_no(self):
+        return self.objectives.shape[1]
+
+    @property
+    def evaluated(self) -> np.ndarray:
+        return ~np.isnan(self.objectives).any(axis=1)
+
+    def vector(self, i) -> list:
+        return self.decisions[i].tolist()
+
+    def vectors(self) -> list:
+        return self.decisions.tolist()
+
+    def take(self, indices) -> "Population":
+        """ :return: New population made of the given rows, in the given order. """
+        indices = np.asarray(indices, dtype=int)
+        result = Population(self.decisions[indices], self.objectives[indices])
+        for column in ("rank", "crowding", "fitness", "alive"):
+            setattr(result, column, getattr(self, column)[indices])
+        return result
+
+    def extend(self, vectors):
+        """ Appends not evaluated individuals. """
+        appended = Population.from_vectors(vectors, self.objectives_no)
+        merged = Population.concatenate(self, appended)
+        self.__dict__.update(merged.__dict__)
+
+    def compact(self):
+        """ Drops the individuals that are not alive. """
+        self.__dict__.update(self.take(np.flatnonzero(self.alive)).__dict__)
+
+    def remove_vectors(self, vectors) -> list:
+        """
+        Removes one individual per given vector (if present).
+
+        :return: The removed vectors.
+        """
+        wanted = [list(map(float, v)) for v in vectors]
+        removed = []
+        for i, vector in enumerate(self.vectors()):
+            if vector in wanted:
+                wanted.remove(vector)
+                removed.append(vector)
+                self.alive[i] = False
+        self.compact()
+        return removed
+
+    def dominance_matrix(self) -> np.ndarray:
+        """ :return: D [n, n] such that D[i, j] <=> individual i dominates j. """
+        return nd_sort.dominance_matrix(self.objectives)
+
+    def objective_distances(self) -> np.ndarray:
+        """ :return: Matrix [n, n] of Euclidean distances in the objective space. """
+        differences = self.objectives[:, np.newaxis, :] - self.objectives[np.newaxis]
+        return np.sqrt(np.einsum("ijk,ijk->ij", differences, differences))
@@ -1,7 +1,11 @@
 import json
 import os
 import pickle
+import re
+import sys
+from pathlib import Path
 
+from simulation.columnar import ColumnarStore
 from simulation.serialization import RESULTS_DIR
 
 # Directory walker with custom functions invoked on each subdirectory (recursively).
@@ -29,6 +33,18 @@ def json2pickle(dirName, fname):
         os.remove(to_convert)
 
 
+def pickle2columnar(dirName, fname):
+    if re.fullmatch("[0-9]+\.pickle", fname):
+        to_convert = os.path.join(dirName, fname)
+        with open(to_convert, "rb") as fh:
+            loaded = pickle.load(fh)
+
+        run_dir = Path(dirName)
+        ColumnarStore(run_dir.parent).append(run_dir.name, fname[:-7], loaded)
+        print("\tmoved to columnar store: %s" % run_dir.parent)
+        os.remove(to_convert)
+
+
 def clear_budget(dirName, fname):
     splitted = fname.split(".")
     budget = int(splitted[0])
@@ -39,5 +55,14 @@ def clear_budget(dirName, fname):
         os.remove(to_remove)
 
 
+TOOLS = {
+    "json2pickle": json2pickle,
+    "pickle2columnar": pickle2columnar,
+    "clear_budget": clear_budget,
+}
+
 if __name__ == "__main__":
-    walk(RESULTS_DIR, json2pickle)
+    # usage: dir_walker.py [tool [results_dir]]
+    tool = sys.argv[1] if len(sys.argv) > 1 else "json2pickle"
+    results_dir = sys.argv[2] if len(sys.argv) > 2 else RESULTS_DIR
+    walk(results_dir, TOOLS[tool])
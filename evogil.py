@@ -6,6 +6,7 @@ Usage:
   evogil.py list
   evogil.py run budget <budget> [options]
   evogil.py run time [(--timeout | -t) <timeout>] [(--step | -s) <step>] [options]
+  evogil.py metrics build [options]
   evogil.py (stats | statistics) [options]
   evogil.py rank
   evogil.py rank_details
@@ -23,6 +24,12 @@ Commands:
             Run with budget constraints. Param: budget(s), list of integers separated by comma.
         time
             Run with timeout constraints. Params: timeout and/or step measured in seconds.
+  metrics
+    Subcommands:
+        build
+            Computes all metrics of all results once and stores them in a single table
+            (metrics.csv in the results directory), which is then read by stats, rank,
+            table and pictures. Rebuild after adding results.
   summary
     Returns number of results for each tuple: algorithm, problem, budget.
   stats
@@ -73,6 +80,10 @@ Options:
         Directory where simulation results will be stored. If not specified, serialization.RESULTS_DIR is set.
   -o <plots_dir>
         Directory where generated plots will be stored. If not specified, pictures.PLOTS_DIR is set.
+  --results-format <format>
+        Storage of the results of a run: "pickle" (a file per run and budget) or
+        "columnar" (a single append-only shard per problem and algorithm).
+        [default: pickle]
   
 Pictures Summary Options:
   --selected <algo_name>
@@ -115,6 +126,7 @@ def main_worker():
 
     run_dict = {
         "run": simulation.run_parallel.run_parallel,
+        "metrics": statistic.stats.build_metrics,
         "statistics": statistic.stats.statistics,
         "stats": statistic.stats.statistics,
         "rank": statistic.ranking.rank,
@@ -0,0 +1,294 @@
+import bisect
+import collections
+
+import numpy as np
+
+# Below this population size the full dominance matrix is the fastest way to rank.
+DOMINANCE_MATRIX_MAX_SIZE = 64
+
+
+def as_objectives(objectives) -> np.ndarray:
+    """ :return: Objective vectors as a float matrix of shape [n, m]. """
+    objectives = np.asarray(objectives, dtype=float)
+    if objectives.ndim == 1:
+        objectives = objectives.reshape(-1, 1)
+    return objectives
+
+
+def dominance_matrix(objectives) -> np.ndarray:
+    """
+    :param objectives: Matrix [n, m] of objective vectors (minimization).
+    :return: Boolean matrix D [n, n] such that D[i, j] <=> i dominates j.
+    """
+    objectives = as_objectives(objectives)
+    a = objectives[:, np.newaxis, :]
+    b = objectives[np.newaxis, :, :]
+    return np.all(a <= b, axis=2) & np.any(a < b, axis=2)
+
+
+def non_dominated_ranks(objectives) -> np.ndarray:
+    """
+    :param objectives: Matrix [n, m] of objective vectors (minimization).
+    :return: Vector of front numbers (0 is the non-dominated front) for every row.
+    """
+    objectives = as_objectives(objectives)
+    n, m = objectives.shape
+    if n == 0:
+        return np.zeros(0, dtype=int)
+    if n <= DOMINANCE_MATRIX_MAX_SIZE:
+        return _matrix_ranks(objectives)
+    if m == 1:
+        return _dense_ranks(objectives[:, 0])
+    if m == 2:
+        return _sweep_ranks_2d(objectives)
+    return _binary_search_ranks(objectives)
+
+
+def non_dominated_fronts(objectives) -> "[np.ndarray]":
+    """ :return: List of index arrays, one per front, best front first. """
+    ranks = non_dominated_ranks(objectives)
+    if len(ranks) == 0:
+        return []
+    order = np.argsort(ranks, kind="stable")
+    bounds = np.searchsorted(ranks[order], np.arange(1, ranks.max() + 1))
+    return np.split(order, bounds)
+
+
+def sort_into_fronts(items, objectives) -> "[[Any]]":
+    """
+    :param items: Sequence of arbitrary objects.
+    :param objectives: Objective vectors of `items`, in the same order.
+    :return: Lists of items grouped by front, best front first.
+    """
+    items = list(items)
+    return [[items[i] for i in front] for front in non_dominated_fronts(objectives)]
+
+
+def front_dict(items, objectives) -> "{int: [Any]}":
+    """ :return: Fronts of `items` numbered from 1, as used by NSGA-II-like drivers. """
+    return collections.defaultdict(
+        list, enumerate(sort_into_fronts(items, objectives), start=1)
+    )
+
+
+def dominated_by_any(objectives, point) -> bool:
+    """ :return: True <=> some row of `objectives` dominates `point`. """
+    objectives = as_objectives(objectives)
+    point = np.asarray(point, dtype=float)
+    return bool(
+        np.any(np.all(objectives <= point, axis=1) & np.any(objectives < point, axis=1))
+    )
+
+
+def insertion_front(fronts, point) -> int:
+    """
+    :param fronts: Objective vectors of consecutive non-dominated fronts, best first.
+    :param point: Objective vector of a new point.
+    :return: Index of the front the point belongs to (len(fronts) for a new last
+        front). If a front dominates the point then so do all better fronts, so the
+        index is found by binary search.
+    """
+    low, high = 0, len(fronts)
+    while low < high:
+        middle = (low + high) // 2
+        if dominated_by_any(fronts[middle], point):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def non_dominated_mask(objectives) -> np.ndarray:
+    """
+    :param objectives: Matrix [n, m] of objective vectors (minimization).
+    :return: Boolean vector, True for the rows no other row dominates. Duplicates of a
+        non-dominated vector are all kept.
+    """
+    objectives = as_objectives(objectives)
+    n, m = objectives.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    if m == 1:
+        return objectives[:, 0] == objectives[:, 0].min()
+    if m == 2:
+        return _kung_mask_2d(objectives)
+    if m == 3:
+        return _kung_mask_3d(objectives)
+    return _block_mask(objectives)
+
+
+def grouped_ranks(groups, values) -> np.ndarray:
+    """
+    Ranks under a dominance that holds only inside a group and is decided by a single
+    value (e.g. theta-dominance in NSGA-III): the rank of an element is the dense rank
+    of its value among the elements of its group.
+    """
+    groups = np.asarray(groups)
+    values = np.asarray(values, dtype=float)
+    ranks = np.zeros(len(values), dtype=int)
+    for group in np.unique(groups):
+        members = np.flatnonzero(groups == group)
+        ranks[members] = _dense_ranks(values[members])
+    return ranks
+
+
+def _dense_ranks(values):
+    _, ranks = np.unique(values, return_inverse=True)
+    return ranks.reshape(-1)
+
+
+def _matrix_ranks(objectives):
+    dominates = dominance_matrix(objectives)
+    dominators = dominates.sum(axis=0)
+    ranks = np.full(len(objectives), -1, dtype=int)
+    rank = 0
+    current = np.flatnonzero(dominators == 0)
+    while len(current):
+        ranks[current] = rank
+        dominators -= dominates[current].sum(axis=0)
+        dominators[current] = -1
+        current = np.flatnonzero(dominators == 0)
+        rank += 1
+    return ranks
+
+
+def _lexicographic_order(objectives):
+    return np.lexsort(objectives.T[::-1])
+
+
+def _sweep_ranks_2d(objectives):
+    """
+    O(n log n) sweep for two objectives: in lexicographic order a point can only be
+    dominated by points already placed, and the last-placed second objective of the
+    fronts is increasing, so the front of a point is found by binary search.
+    """
+    order = _lexicographic_order(objectives)
+    ranks = np.empty(len(objectives), dtype=int)
+    fronts_last = []
+    previous = None
+    for i in order:
+        point = objectives[i]
+        if previous is not None and np.array_equal(point, objectives[previous]):
+            rank = ranks[previous]
+        else:
+            rank = bisect.bisect_right(fronts_last, point[1])
+            if rank == len(fronts_last):
+                fronts_last.append(point[1])
+        fronts_last[rank] = point[1]
+        ranks[i] = rank
+        previous = i
+    return ranks
+
+
+def _binary_search_ranks(objectives):
+    """
+    Efficient non-dominated sort with binary search (ENS-BS) for three and more
+    objectives; the check of a point against a whole front is vectorized.
+    """
+    order = _lexicographic_order(objectives)
+    n, m = objectives.shape
+    ranks = np.empty(n, dtype=int)
+    fronts = []
+    sizes = []
+
+    def front_dominates(front_no, point):
+        members = fronts[front_no][: sizes[front_no]]
+        return np.any(
+            np.all(members <= point, axis=1) & np.any(members < point, axis=1)
+        )
+
+    for i in order:
+        point = objectives[i]
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if front_dominates(middle, point):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append(np.empty((4, m)))
+            sizes.append(0)
+        if sizes[low] == len(fronts[low]):
+            fronts[low] = np.concatenate([fronts[low], np.empty_like(fronts[low])])
+        fronts[low][sizes[low]] = point
+        sizes[low] += 1
+        ranks[i] = low
+    return ranks
+
+
+def _group_starts(sorted_objectives):
+    """ :return: For each row of a sorted matrix, the index of its first duplicate. """
+    new_group = np.ones(len(sorted_objectives), dtype=bool)
+    new_group[1:] = np.any(sorted_objectives[1:] != sorted_objectives[:-1], axis=1)
+    return np.maximum.accumulate(np.where(new_group, np.arange(len(new_group)), 0))
+
+
+def _kung_mask_2d(objectives):
+    """
+    In lexicographic order a point is dominated iff some distinct point placed before
+    it has a second objective not greater than its own.
+    """
+    order = _lexicographic_order(objectives)
+    ordered = objectives[order]
+    best_before = np.concatenate([[np.inf], np.minimum.accumulate(ordered[:, 1])])
+    mask = np.empty(len(objectives), dtype=bool)
+    mask[order] = best_before[_group_starts(ordered)] > ordered[:, 1]
+    return mask
+
+
+def _kung_mask_3d(objectives):
+    """
+    Sweep in lexicographic order keeping the two-objective staircase of the points
+    placed so far (second objective increasing, third decreasing); a point is dominated
+    iff the staircase step at its second objective is not above its third objective.
+    """
+    order = _lexicographic_order(objectives)
+    ordered = objectives[order]
+    starts = _group_starts(ordered)
+    mask = np.empty(len(objectives), dtype=bool)
+    stairs_y, stairs_z = [], []
+    for i in range(len(ordered)):
+        _, y, z = ordered[i]
+        if starts[i] != i:
+            mask[order[i]] = mask[order[starts[i]]]
+            continue
+        step = bisect.bisect_right(stairs_y, y) - 1
+        dominated = step >= 0 and stairs_z[step] <= z
+        mask[order[i]] = not dominated
+        if not dominated:
+            first = step + 1
+            last = first
+            while last < len(stairs_z) and stairs_z[last] >= z:
+                last += 1
+            if step >= 0 and stairs_y[step] == y:
+                first = step
+            stairs_y[first:last] = [y]
+            stairs_z[first:last] = [z]
+    return mask
+
+
+def _block_mask(objectives, block_size=256):
+    """
+    Vectorized filter for four and more objectives. A dominating point never has a
+    greater sum of objectives, so in the order of sums a block is compared only with
+    the points before it and with the points tied with its largest sum.
+    """
+    sums = objectives.sum(axis=1)
+    order = np.argsort(sums, kind="stable")
+    ordered = objectives[order]
+    ordered_sums = sums[order]
+    candidate = np.ones(len(ordered), dtype=bool)
+    for start in range(0, len(ordered), block_size):
+        block = ordered[start : start + block_size]
+        end = np.searchsorted(
+            ordered_sums, ordered_sums[start + len(block) - 1], "right"
+        )
+        others = ordered[:end][candidate[:end]]
+        a = others[np.newaxis, :, :]
+        b = block[:, np.newaxis, :]
+        dominated = np.any(np.all(a <= b, axis=2) & np.any(a < b, axis=2), axis=1)
+        candidate[start : start + len(block)] = ~dominated
+    mask = np.empty(len(objectives), dtype=bool)
+    mask[order] = candidate
+    return mask
@@ -3,33 +3,87 @@ import math
 
 import numpy as np
 
+from evotools import nd_sort
 from evotools.ea_utils import dominates
 
 EPSILON = np.finfo(float).eps
 
 
+# Upper bound on the number of float64 cells of a single difference block
+# (rows x columns x objectives) kept in memory by the pairwise kernels.
+BLOCK_CELLS = 2 ** 21
+
+
+def as_points(points) -> np.ndarray:
+    """ :return: Objective vectors as a float matrix of shape [n, m]. """
+    points = np.asarray(list(points), dtype=float)
+    if points.ndim == 1:
+        points = points.reshape(len(points), -1 if len(points) else 0)
+    return points
+
+
+def pairwise_blocks(from_set, to_set, kernel):
+    """
+    Evaluates `kernel` on row blocks of `from_set` against the whole `to_set`, so that
+    the [rows, len(to_set), m] difference tensor never exceeds BLOCK_CELLS cells.
+
+    :param kernel: function (differences [r, t, m]) -> [r, t] reducing the objectives.
+    :return: generator of (first row of the block, kernel value [r, t]).
+    """
+    from_set = as_points(from_set)
+    to_set = as_points(to_set)
+    cells_per_row = max(1, to_set.shape[0] * to_set.shape[1])
+    rows = max(1, BLOCK_CELLS // cells_per_row)
+    for start in range(0, len(from_set), rows):
+        differences = (
+            to_set[np.newaxis, :, :] - from_set[start : start + rows, np.newaxis, :]
+        )
+        yield start, kernel(differences)
+
+
+def sqr_euclid_kernel(differences):
+    return np.einsum("ijk,ijk->ij", differences, differences)
+
+
+def manhattan_kernel(differences):
+    return np.abs(differences).sum(axis=2)
+
+
+def min_distances(from_set, to_set, kernel=sqr_euclid_kernel, skip_self=False):
+    """
+    :param skip_self: `from_set` and `to_set` are the same set and the distance of a
+        point to itself is not taken into account.
+    :return: Vector of the distances from each point of `from_set` to the nearest
+        point of `to_set`.
+    """
+    result = []
+    for start, block in pairwise_blocks(from_set, to_set, kernel):
+        if skip_self:
+            rows = np.arange(len(block))
+            block[rows, rows + start] = np.inf
+        result.append(block.min(axis=1))
+    if not result:
+        return np.zeros(0)
+    return np.concatenate(result)
+
+
 def distance_from_pareto(solution, pareto):
     logger = logging.getLogger(__name__)
     solution = list(solution)
     logger.debug("distance_from_pareto: input length %d", len(solution))
-    return sum([min([euclid_distance(x, y) for y in pareto]) for x in solution]) / len(
-        solution
-    )
+    return float(np.sqrt(min_distances(solution, pareto)).sum()) / len(solution)
 
 
 def distribution(solution, sigma=0.5):
     logger = logging.getLogger(__name__)
     solution = list(solution)
     logger.debug("distribution: input length %d", len(solution))
+    farther = sum(
+        int(np.count_nonzero(np.sqrt(block) > sigma))
+        for _, block in pairwise_blocks(solution, solution, sqr_euclid_kernel)
+    )
     try:
-        return sum(
-            sum(
-                1
-                for y in solution
-                if sigma < math.sqrt(sum((x1 - y1) ** 2 for x1, y1 in zip(x, y)))
-            )
-            for x in solution
-        ) / (len(solution) * (len(solution) - 1))
+        return farther / (len(solution) * (len(solution) - 1))
     except ZeroDivisionError:
         return float("inf")
 
@@ -37,12 +91,8 @@ def distribution(solution, sigma=0.5):
 def extent(solution):
     logger = logging.getLogger(__name__)
     logger.debug("extent: input length %d", len(solution))
-    return math.sqrt(
-        sum(
-            max(math.fabs(x[i] - y[i]) for x in solution for y in solution)
-            for i in range(len(solution[0]))
-        )
-    )
+    # the largest distance over all pairs on an axis is the range of the axis
+    return math.sqrt(float(np.ptp(as_points(solution), axis=0).sum()))
 
 
 def euclid_distance(xs, ys):
@@ -66,29 +116,37 @@ def non_domination_ratio(solution, not_dominated_solution):
 
 
 def spacing(solution):
-    dims = len(solution[0])
-
-    min_distances = []
-    for i, ind_a in enumerate(solution):
-        distances = []
-        for j, ind_b in enumerate(solution):
-            if not i == j:
-                dist = sum([math.fabs(ind_a[k] - ind_b[k]) for k in range(dims)])
-                distances.append(dist)
-        if len(distances) > 0:
-            min_distances.append(min(distances))
-
-    if len(min_distances) > 0:
-        mean_dist = np.mean(min_distances)
+    min_dists = min_distances(solution, solution, manhattan_kernel, skip_self=True)
+    min_dists = min_dists[np.isfinite(min_dists)]
+
+    if len(min_dists) > 0:
+        mean_dist = np.mean(min_dists)
     else:
         mean_dist = 0
-    dist_sum = sum([(mean_dist - dist) ** 2 for dist in min_distances])
+    dist_sum = float(((mean_dist - min_dists) ** 2).sum())
     return math.sqrt(dist_sum / (float(len(solution) - 1) + EPSILON))
 
 
 def distance(from_set, to_set):
-    distances = [min([euclid_sqr_distance(f, t) for t in to_set]) for f in from_set]
-    return math.sqrt(sum(distances) / len(distances))
+    distances = min_distances(from_set, to_set)
+    return math.sqrt(float(distances.sum()) / len(distances))
+
+
+def additive_epsilon(solution, pareto, signs):
+    """
+    :param signs: Per-objective sign of the difference (pareto - solution).
+    :return: max over solution of min over pareto of max over objectives of the
+        signed differences.
+    """
+    signs = np.asarray(signs, dtype=float)
+
+    def kernel(differences):
+        return (differences * signs).max(axis=2)
+
+    eps = float("-inf")
+    for _, block in pairwise_blocks(solution, pareto, kernel):
+        eps = max(eps, float(block.min(axis=1).max()))
+    return eps
 
 
 def pareto_dominance_indicator(solution, not_dominated_solution, all_solutions):
@@ -112,16 +170,6 @@ def filter_not_dominated2(ind_set):
 
 
 def filter_not_dominated(ind_set):
-    not_dominated = []
-    for ind in ind_set:
-        dominated_by_sth = False
-        new_not_dominated = []
-        for nd_ind in not_dominated:
-            if not dominates(ind, nd_ind):
-                new_not_dominated.append(nd_ind)
-            if dominates(nd_ind, ind):
-                dominated_by_sth = True
-        if not dominated_by_sth:
-            new_not_dominated.append(ind)
-        not_dominated = new_not_dominated
-    return not_dominated
+    ind_set = list(ind_set)
+    mask = nd_sort.non_dominated_mask(ind_set)
+    return [ind for ind, not_dominated in zip(ind_set, mask) if not_dominated]
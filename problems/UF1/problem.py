@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 n = 30
 p_no = 150
@@ -32,3 +33,19 @@ def fit_2(x):
 name = "UF1"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-1, 1)] * (n - 1)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - np.sin(6 * np.pi * xs[:, :1] + J * np.pi / n)
+    return 2 / len(J) * (ys ** 2).sum(axis=1)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    return np.column_stack(
+        [
+            xs[:, 0] + batch_base_fit(xs, J1),
+            1 - np.sqrt(xs[:, 0]) + batch_base_fit(xs, J2),
+        ]
+    )
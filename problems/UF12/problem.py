@@ -112,6 +112,41 @@ dims = [
     )
 ]
 
+
+def batch_z_bis(zs):
+    lambdas_row = np.array(lambdas)
+    return np.where(
+        zs < 0, -lambdas_row * zs, np.where(zs > 1, lambdas_row * zs, zs)
+    )
+
+
+def batch_base_fit_cos(z_bis, m):
+    return np.prod(np.cos((z_bis[:, :m] * np.pi) / 2.0), axis=1)
+
+
+def batch_S(z_bis, m):
+    ps = np.where(z_bis < 0, -z_bis, np.where(z_bis > 1, z_bis - 1, 0))[:, :m]
+    return 2 / (1 + np.exp(-np.sqrt((ps ** 2).sum(axis=1))))
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    zs = xs.dot(M.T)
+    z_b = batch_z_bis(zs)
+    non_negative = np.all(zs >= 0, axis=1)
+    g_value = 100 * (
+        zs.shape[1]
+        + ((zs - 0.5) ** 2 - np.cos(20 * np.pi * (zs - 0.5))).sum(axis=1)
+    )
+    columns = []
+    for m in range(1, f_dims + 1):
+        up = (1 + g_value) * batch_base_fit_cos(z_b, m - 1) * (
+            np.sin(z_b[:, m - 1]) if m < f_dims else 1
+        ) + 1
+        columns.append(np.where(non_negative, up, batch_S(z_b, m - 1) * up))
+    return np.column_stack(columns)
+
+
 if __name__ == "__main__":
     print("Dims:")
     print(dims)
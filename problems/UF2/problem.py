@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 n = 30
 p_no = 150
@@ -43,3 +44,22 @@ def fit_2(x):
 name = "UF2"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-1, 1)] * (n - 1)
+
+
+def batch_base_fit(xs, J, trig):
+    J = np.array(J)
+    x0 = xs[:, :1]
+    ys = xs[:, J - 1] - (
+        0.3 * x0 ** 2 * np.cos(24 * np.pi * x0 + 4 * J * np.pi / n) + 0.6 * x0
+    ) * trig(6 * np.pi * x0 + J * np.pi / n)
+    return 2 / len(J) * (ys ** 2).sum(axis=1)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    return np.column_stack(
+        [
+            xs[:, 0] + batch_base_fit(xs, J1, np.cos),
+            1 - np.sqrt(xs[:, 0]) + batch_base_fit(xs, J2, np.sin),
+        ]
+    )
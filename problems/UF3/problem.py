@@ -1,6 +1,7 @@
 import functools
 import math
 import operator
+import numpy as np
 
 n = 30
 p_no = 150
@@ -48,3 +49,20 @@ def fit_2(x):
 name = "UF3"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] * n
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - xs[:, :1] ** (0.5 * (1.0 + (3 * (J - 2)) / (n - 2)))
+    products = np.prod(np.cos((20 * ys * np.pi) / np.sqrt(J)), axis=1)
+    return 2 * (4 * (ys ** 2).sum(axis=1) - 2 * products + 2) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    return np.column_stack(
+        [
+            xs[:, 0] + batch_base_fit(xs, J1),
+            1 - np.sqrt(xs[:, 0]) + batch_base_fit(xs, J2),
+        ]
+    )
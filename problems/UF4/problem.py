@@ -1,6 +1,7 @@
 import functools
 import math
 import operator
+import numpy as np
 
 n = 30
 p_no = 150
@@ -36,3 +37,19 @@ def fit_2(x):
 name = "UF4"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-2, 2)] * (n - 1)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ts = np.abs(xs[:, J - 1] - np.sin(6 * np.pi * xs[:, :1] + (J * np.pi) / n))
+    return (2 * (ts / (1 + np.exp(2 * ts))).sum(axis=1)) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    return np.column_stack(
+        [
+            xs[:, 0] + batch_base_fit(xs, J1),
+            1 - xs[:, 0] ** 2 + batch_base_fit(xs, J2),
+        ]
+    )
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 n = 10
 eps = 0.1
@@ -35,3 +36,19 @@ def fit_2(x):
 name = "UF5"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-1, 1)] * (n - 1)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - np.sin(6 * np.pi * xs[:, :1] + (J * np.pi) / n)
+    hs = 2 * ys ** 2 - np.cos(4 * np.pi * ys) + 1
+    return (1 / (2 * n) + eps) * np.abs(np.sin(2 * n * np.pi * xs[:, 0])) + (
+        2 * hs.sum(axis=1)
+    ) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    return np.column_stack(
+        [xs[:, 0] + batch_base_fit(xs, J1), 1 - xs[:, 0] + batch_base_fit(xs, J2)]
+    )
@@ -2,6 +2,7 @@ import functools
 import math
 import operator
 import numpy
+import numpy as np
 
 n = 30
 eps = 0.1
@@ -60,3 +61,23 @@ def fit_2(x):
 name = "UF6"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-1, 1)] * (n - 1)
+
+
+def batch_base_fit(xs, J):
+    J = numpy.array(J)
+    ys = xs[:, J - 1] - numpy.sin(6 * numpy.pi * xs[:, :1] + (J * numpy.pi) / n)
+    products = numpy.prod(numpy.cos((20 * ys * numpy.pi) / numpy.sqrt(J)), axis=1)
+    inner = 2 * (4 * (ys ** 2).sum(axis=1) - 2 * products + 2) / len(J)
+    return (
+        numpy.maximum(
+            0, 2 * (1 / (2 * n) + eps) * numpy.sin(2 * n * numpy.pi * xs[:, 0])
+        )
+        + inner
+    )
+
+
+def evaluate_batch(xs):
+    xs = numpy.asarray(xs, dtype=float)
+    return numpy.column_stack(
+        [xs[:, 0] + batch_base_fit(xs, J1), 1 - xs[:, 0] + batch_base_fit(xs, J2)]
+    )
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 n = 30
 p_no = 150
@@ -30,3 +31,17 @@ def fit_2(x):
 name = "UF7"
 fitnesses = [fit_1, fit_2]
 dims = [(0, 1)] + [(-1, 1)] * (n - 1)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - np.sin(6 * np.pi * xs[:, :1] + (J * np.pi) / n)
+    return (2 * (ys ** 2).sum(axis=1)) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f = xs[:, 0] ** 0.2
+    return np.column_stack(
+        [f + batch_base_fit(xs, J1), 1 - f + batch_base_fit(xs, J2)]
+    )
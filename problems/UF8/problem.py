@@ -1,5 +1,6 @@
 import math
 import itertools
+import numpy as np
 
 n = 30
 p_no = 150
@@ -50,3 +51,24 @@ def fit_3(x):
 name = "UF8"
 fitnesses = [fit_1, fit_2, fit_3]
 dims = [(0, 1)] * 2 + [(-2, 2)] * (n - 2)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - 2 * xs[:, 1:2] * np.sin(
+        2 * np.pi * xs[:, :1] + (J * np.pi) / n
+    )
+    return (2 * (ys ** 2).sum(axis=1)) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    a = 0.5 * xs[:, 0] * np.pi
+    b = 0.5 * xs[:, 1] * np.pi
+    return np.column_stack(
+        [
+            np.cos(a) * np.cos(b) + batch_base_fit(xs, J1),
+            np.cos(a) * np.sin(b) + batch_base_fit(xs, J2),
+            np.sin(a) + batch_base_fit(xs, J3),
+        ]
+    )
@@ -1,5 +1,6 @@
 import math
 import itertools
+import numpy as np
 
 n = 30
 eps = 0.1
@@ -50,3 +51,24 @@ def fit_3(x):
 name = "UF9"
 fitnesses = [fit_1, fit_2, fit_3]
 dims = [(0, 1)] * 2 + [(-2, 2)] * (n - 2)
+
+
+def batch_base_fit(xs, J):
+    J = np.array(J)
+    ys = xs[:, J - 1] - 2 * xs[:, 1:2] * np.sin(
+        2 * np.pi * xs[:, :1] + (J * np.pi) / n
+    )
+    return (2 * (ys ** 2).sum(axis=1)) / len(J)
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    x0, x1 = xs[:, 0], xs[:, 1]
+    m = np.maximum(0, (1 + eps) * (1 - 4 * (2 * x0 - 1) ** 2))
+    return np.column_stack(
+        [
+            0.5 * (m + 2 * x0) * x1 + batch_base_fit(xs, J1),
+            0.5 * (m - 2 * x0 + 2) * x1 + batch_base_fit(xs, J2),
+            1 - x1 + batch_base_fit(xs, J3),
+        ]
+    )
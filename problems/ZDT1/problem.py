@@ -1,5 +1,6 @@
 import functools
 import math
+import numpy as np
 
 p_no = 150
 emoa_points = [i / (p_no - 1) for i in range(p_no)]
@@ -62,3 +63,10 @@ fitnesses, dims, name, pareto_front = emoa_fitnesses(
 )
 
 pareto_front = [[x, y] for x, y in zip(pareto_front[0], pareto_front[1])]
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f1 = xs[:, 0]
+    g = 1 + 0.3103448275862069 * xs[:, 1:].sum(axis=1)
+    return np.column_stack([f1, g * (1 - np.sqrt(np.abs(f1 / g)))])
@@ -1,4 +1,5 @@
 import functools
+import numpy as np
 
 p_no = 150
 emoa_points = [i / (p_no - 1) for i in range(p_no)]
@@ -61,3 +62,10 @@ fitnesses, dims, name, pareto_front = emoa_fitnesses(
 )
 
 pareto_front = [[x, y] for x, y in zip(pareto_front[0], pareto_front[1])]
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f1 = xs[:, 0]
+    g = 1 + 0.3103448275862069 * xs[:, 1:].sum(axis=1)
+    return np.column_stack([f1, g * (1 - (f1 / g) ** 2)])
@@ -1,6 +1,7 @@
 import functools
 import math
 from evotools import ea_utils
+import numpy as np
 
 p_no = 150
 emoa_points = [i / (p_no - 1) for i in range(p_no)]
@@ -85,3 +86,12 @@ fitnesses, dims, name, pareto_front = emoa_fitnesses(
 pareto_front = trim_dominated(
     [[x, y] for x, y in zip(pareto_front[0], pareto_front[1])]
 )
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f1 = xs[:, 0]
+    g = 1 + 0.3103448275862069 * xs[:, 1:].sum(axis=1)
+    f1_g = f1 / g
+    h = 1 - np.sqrt(np.abs(f1_g)) - f1_g * np.sin(10 * np.pi * f1)
+    return np.column_stack([f1, g * h])
@@ -1,5 +1,6 @@
 import functools
 import math
+import numpy as np
 
 dims = [(-5, 5), (-5, 5), (-5, 5)]
 pareto_set = []
@@ -68,3 +69,10 @@ fitnesses, dims, name, pareto_front = emoa_fitnesses2(
     f1d, gd, hd, 10, "d", emoa_d_analytical
 )
 pareto_front = [[x, y] for x, y in zip(pareto_front[0], pareto_front[1])]
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f1 = xs[:, 0]
+    g = 91 + (xs[:, 1:] ** 2 - 10 * np.cos(fpi * xs[:, 1:])).sum(axis=1)
+    return np.column_stack([f1, g * (1 - np.sqrt(np.abs(f1 / g)))])
@@ -1,5 +1,6 @@
 import functools
 import math
+import numpy as np
 
 dims = [(-5, 5), (-5, 5), (-5, 5)]
 pareto_set = []
@@ -68,3 +69,10 @@ fitnesses, dims, name, pareto_front = emoa_fitnesses(
     f1e, ge, he, 10, "e", emoa_e_analytical
 )
 pareto_front = [[x, y] for x, y in zip(pareto_front[0], pareto_front[1])]
+
+
+def evaluate_batch(xs):
+    xs = np.asarray(xs, dtype=float)
+    f1 = 1 - np.exp(-4 * xs[:, 0]) * (np.sin(spi * xs[:, 0]) ** 6)
+    g = 1 + 5.19615 * xs[:, 1:].sum(axis=1) ** 0.25
+    return np.column_stack([f1, g * (1 - (f1 / g) ** 2)])
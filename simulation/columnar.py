@@ -0,0 +1,166 @@
+import hashlib
+import pickle
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+import numpy as np
+
+from simulation.model import SimulationCase
+from simulation.serializer import Result, Serializer
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+RESULTS_FORMAT_PARAM = "results_format"
+
+PICKLE_FORMAT = "pickle"
+COLUMNAR_FORMAT = "columnar"
+
+DATA_FILE = "results.f64"
+INDEX_FILE = "results.index"
+LOCK_FILE = "results.lock"
+
+DTYPE = np.dtype("<f8")
+
+
+class ColumnarStore:
+    """
+    Append-only shard with the results of one (problem, algorithm) pair.
+
+    Populations and fitnesses of all runs are kept as contiguous float64 blocks in a
+    single data file. The index file is a stream of pickled records keyed by
+    (simulation id, name), where the name is the budget or the time slot. Blocks are
+    content-addressed: a block identical to an already stored one is not written again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data_path = self.path / DATA_FILE
+        self.index_path = self.path / INDEX_FILE
+        self.lock_path = self.path / LOCK_FILE
+        self.offsets = {}
+        self.index_position = 0
+
+    def exists(self) -> bool:
+        return self.index_path.is_file()
+
+    def records(self) -> list:
+        records = []
+        with suppress(FileNotFoundError):
+            with self.index_path.open(mode="rb") as fh:
+                while True:
+                    try:
+                        records.append(pickle.load(fh))
+                    except EOFError:
+                        break
+        return records
+
+    def simulation_ids(self) -> set:
+        return {record["simulation_id"] for record in self.records()}
+
+    def append(self, simulation_id: str, name: str, result: Result):
+        population = np.asarray(result.population, dtype=DTYPE)
+        fitnesses = np.asarray(result.fitnesses, dtype=DTYPE)
+        block = np.concatenate([population.ravel(), fitnesses.ravel()])
+        digest = hashlib.sha1(block.tobytes()).hexdigest()
+
+        with suppress(FileExistsError):
+            self.path.mkdir(parents=True)
+        with self._locked():
+            self._read_new_records()
+            if digest in self.offsets:
+                offset = self.offsets[digest]
+            else:
+                with self.data_path.open(mode="ab") as fh:
+                    offset = fh.tell() // DTYPE.itemsize
+                    fh.write(block.tobytes())
+            record = {
+                "simulation_id": simulation_id,
+                "name": name,
+                "digest": digest,
+                "offset": offset,
+                "population_shape": population.shape,
+                "fitnesses_shape": fitnesses.shape,
+                "additional_data": result.additional_data,
+            }
+            with self.index_path.open(mode="ab") as fh:
+                pickle.dump(record, fh)
+            self._read_new_records()
+
+    def _read_new_records(self):
+        """ Updates the digest lookup with records appended since the last call. """
+        with suppress(FileNotFoundError):
+            with self.index_path.open(mode="rb") as fh:
+                fh.seek(self.index_position)
+                while True:
+                    try:
+                        record = pickle.load(fh)
+                    except EOFError:
+                        break
+                    self.offsets.setdefault(record["digest"], record["offset"])
+                self.index_position = fh.tell()
+
+    def load_all(self) -> dict:
+        """ :return: {(simulation id, name): Result}, read with one pass over the shard. """
+        records = self.records()
+        if not records:
+            return {}
+        data = np.fromfile(str(self.data_path), dtype=DTYPE)
+        results = {}
+        for record in records:
+            population_size = int(np.prod(record["population_shape"]))
+            fitnesses_size = int(np.prod(record["fitnesses_shape"]))
+            start = record["offset"]
+            population = data[start : start + population_size]
+            fitnesses = data[
+                start + population_size : start + population_size + fitnesses_size
+            ]
+            results[(record["simulation_id"], record["name"])] = Result(
+                population.reshape(record["population_shape"]).tolist(),
+                fitnesses.reshape(record["fitnesses_shape"]).tolist(),
+                **record["additional_data"],
+            )
+        return results
+
+    @contextmanager
+    def _locked(self):
+        with self.lock_path.open(mode="a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class ColumnarSerializer:
+    """ Serializer interface on top of the (problem, algorithm) shard. """
+
+    def __init__(self, simulation_case: SimulationCase):
+        self.simulation_id = simulation_case.id
+        self.store_path = Path(
+            simulation_case.results_dir,
+            simulation_case.problem_name,
+            simulation_case.algorithm_name,
+        )
+        self.path = self.store_path / simulation_case.id
+        self.columnar_store = ColumnarStore(self.store_path)
+
+    def store(self, result: Result, file_name: str) -> Path:
+        self.columnar_store.append(self.simulation_id, str(file_name), result)
+        return self.get_result_path(file_name)
+
+    def get_result_path(self, file_name) -> Path:
+        return self.path / f"{file_name}.pickle"
+
+    def load(self, file_name) -> Result:
+        return self.columnar_store.load_all()[(self.simulation_id, str(file_name))]
+
+
+def create_serializer(simulation_case: SimulationCase):
+    if simulation_case.params.get(RESULTS_FORMAT_PARAM) == COLUMNAR_FORMAT:
+        return ColumnarSerializer(simulation_case)
+    return Serializer(simulation_case)
@@ -1,3 +1,4 @@
+import inspect
 import logging
 from contextlib import suppress
 from functools import partial
@@ -7,7 +8,7 @@ from typing import List, Dict, Any
 
 from evotools.ea_utils import gen_population
 from evotools.random_tools import show_partial, show_conf
-from simulation import run_config, serialization, worker
+from simulation import columnar, run_config, serialization, worker
 from simulation.model import SimulationCase
 from simulation.run_config import NotViableConfiguration
 
@@ -43,6 +44,7 @@ def create_time_bound_simulation(args: Dict[str, str]):
 
 
 def create_simulation(args: Dict[str, str], params: Dict[str, Any]):
+    params = {columnar.RESULTS_FORMAT_PARAM: resolve_results_format(args), **params}
     order = list(product(run_config.problems, run_config.algorithms))
 
     logger.debug("Available problems * algorithms: %s", order)
@@ -138,6 +140,8 @@ def prepare_with_driver(
         config = {}
 
         load_obligatory_problem_parameters(config, problem_mod)
+        if driver_pos == 0:
+            load_batch_evaluation(algo_class, config, problem_mod)
 
         if driver:
             update = {"driver": driver}
@@ -341,6 +345,21 @@ def load_obligatory_problem_parameters(config: Dict[str, str], problem_mod):
     logger.debug("config: %s", show_conf(config))
 
 
+def load_batch_evaluation(algo_class, config: Dict[str, str], problem_mod):
+    """
+    Batched evaluation of the problem, for drivers that support it.
+    Only the outermost driver gets it: sub-drivers of HGS evaluate blurred fitnesses.
+    """
+    evaluate_batch = getattr(problem_mod, "evaluate_batch", None)
+    if evaluate_batch is None:
+        return
+    if "evaluate_batch" not in inspect.signature(algo_class).parameters:
+        return
+    update = {"evaluate_batch": evaluate_batch}
+    logger.debug("Batched evaluation: %s", update)
+    config.update(update)
+
+
 def prepare_problem_class(problem: str):
     problem_mod = ".".join(["problems", problem, "problem"])
     problem_mod = import_module(problem_mod)
@@ -377,3 +396,10 @@ def prepare_message_adapter_class(algo: str, all_drivers: List[str], driver_pos:
 
 def resolve_results_dir(args):
     return args["--dir"] or serialization.RESULTS_DIR
+
+
+def resolve_results_format(args):
+    results_format = args["--results-format"] or columnar.PICKLE_FORMAT
+    if results_format not in (columnar.PICKLE_FORMAT, columnar.COLUMNAR_FORMAT):
+        raise ValueError(f"Unknown results format: {results_format}")
+    return results_format
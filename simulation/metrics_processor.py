@@ -11,14 +11,12 @@ from pathlib import Path
 from typing import List
 
 from metrics import metrics
-from simulation import serializer
+from simulation import columnar, serializer
+from simulation.model import SIMULATION_ID_PATTERN
 from simulation.serializer import ResultWithMetadata
 
 
 def yield_metrics(result_list: List[ResultWithMetadata], problem_mod):
-    for result in result_list:
-        result.non_dominated_fitnesses = metrics.filter_not_dominated(result.fitnesses)
-
     yield "cost", "cost", [
         partial(float, x.additional_data["cost"]) for x in result_list
     ]
@@ -67,6 +65,13 @@ def yield_metrics(result_list: List[ResultWithMetadata], problem_mod):
     ]
 
 
+def non_dominated_fitnesses(result: ResultWithMetadata):
+    # computed on the first metric that is not cached yet
+    if not hasattr(result, "non_dominated_fitnesses"):
+        result.non_dominated_fitnesses = metrics.filter_not_dominated(result.fitnesses)
+    return result.non_dominated_fitnesses
+
+
 def get_metric(
     result: ResultWithMetadata, metric_name, metric_mod_name=None, metric_params=None
 ):
@@ -101,19 +106,21 @@ def get_metric(
         metric_mod = import_module(".".join(metric_mod_name))
         metric_fun = getattr(metric_mod, metric_name)
         metric_val = metric_fun(
-            result.fitnesses, result.non_dominated_fitnesses, **metric_params
+            result.fitnesses, non_dominated_fitnesses(result), **metric_params
         )
 
-        with metric_path.open(mode="wb") as fh:
-            pickle_store = {
-                "value": metric_val,
-                "metric": {
-                    "name": metric_name,
-                    "module": metric_mod_name,
-                    "params": metric_params,
-                },
-            }
-            pickle.dump(pickle_store, fh)
+        # results read from a columnar shard have no run directory to cache in
+        if metric_path.parent.is_dir():
+            with metric_path.open(mode="wb") as fh:
+                pickle_store = {
+                    "value": metric_val,
+                    "metric": {
+                        "name": metric_name,
+                        "module": metric_mod_name,
+                        "params": metric_params,
+                    },
+                }
+                pickle.dump(pickle_store, fh)
 
         return metric_val
     except Exception as e:
@@ -167,7 +174,6 @@ def pareto_dominance_indicator(result: ResultWithMetadata, cache):
         preload_results_for_problem(cache, result.path.parent.parent.parent)
     try:
         all_solutions = cache[(problem, result.name, run_no)]
-        print("cache: " +str(cache))
         return get_metric(
             result,
             "pareto_dominance_indicator",
@@ -191,28 +197,43 @@ def preload_results_for_problem(cache, problem_path: Path):
     logger.debug("Loading for problem : {}".format(problem_name))
     for algo_path in problem_path.iterdir():
         if algo_path.is_dir():
-            runs = [run for run in algo_path.iterdir() if run.is_dir()]
+            shard = columnar.ColumnarStore(algo_path).load_all()
+            runs = {run.name for run in algo_path.iterdir() if run.is_dir()}
+            runs |= {simulation_id for simulation_id, _ in shard}
+            runs = [
+                run for run in sorted(runs) if re.fullmatch(SIMULATION_ID_PATTERN, run)
+            ]
             for run_no in range(len(runs)):
-                for result_file in runs[run_no].iterdir():
-                    try:
-                        print(result_file)
-                        match = re.fullmatch(
-                            "(?P<name>[0-9]+)\.pickle", result_file.name
-                        )
-
-                        result_name = match.groupdict()["name"]
-                        result = serializer.load_file(result_file)
-
-                        logger.debug(
-                            "Caching for algo: {} ... {}".format(
-                                algo_path.name, (problem_name, result_name, run_no)
+                run_results = {
+                    name: result
+                    for (simulation_id, name), result in shard.items()
+                    if simulation_id == runs[run_no]
+                }
+                with suppress(FileNotFoundError):
+                    for result_file in (algo_path / runs[run_no]).iterdir():
+                        try:
+                            match = re.fullmatch(
+                                "(?P<name>[0-9]+)\.pickle", result_file.name
                             )
+
+                            result_name = match.groupdict()["name"]
+                            if result_name not in run_results:
+                                run_results[result_name] = serializer.load_file(
+                                    result_file
+                                )
+                        except (AttributeError, IsADirectoryError):
+                            pass
+                for result_name, result in sorted(run_results.items()):
+                    if not re.fullmatch("[0-9]+", result_name):
+                        continue
+                    logger.debug(
+                        "Caching for algo: {} ... {}".format(
+                            algo_path.name, (problem_name, result_name, run_no)
                         )
-                        cache[(problem_name, result_name, run_no)].append(
-                            result.fitnesses
-                        )
-                    except (AttributeError, IsADirectoryError):
-                        pass
+                    )
+                    cache[(problem_name, result_name, run_no)].append(
+                        result.fitnesses
+                    )
     filter_non_dominated_in_cache(problem_path, cache)
 
 
@@ -0,0 +1,67 @@
+import csv
+import os
+from functools import partial
+from pathlib import Path
+from typing import List
+
+from simulation import metrics_processor
+from simulation.serializer import ResultWithMetadata
+
+# Tidy table with one row per (result, metric), written by `evogil.py metrics build`.
+TABLE_FILE = "metrics.csv"
+
+COLUMNS = ("problem", "algo", "run", "budget_or_time", "metric", "value")
+
+
+def table_key(result: ResultWithMetadata, metric_name):
+    case = result.simulation_case
+    return case.problem_name, case.algorithm_name, case.id, result.name, metric_name
+
+
+def table_rows(results: List[ResultWithMetadata], metric_name, values):
+    for result, value in zip(results, values):
+        yield table_key(result, metric_name) + (value,)
+
+
+def save(results_dir, rows):
+    table_path = Path(results_dir, TABLE_FILE)
+    tmp_path = table_path.with_suffix(".tmp")
+    with tmp_path.open(mode="w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(COLUMNS)
+        for *key, value in rows:
+            writer.writerow(key + ["" if value is None else repr(float(value))])
+    os.replace(str(tmp_path), str(table_path))
+    return table_path
+
+
+def load(results_dir):
+    """ :return: {table key: value}, or None if the table has not been built. """
+    table_path = Path(results_dir, TABLE_FILE)
+    if not table_path.is_file():
+        return None
+    table = {}
+    with table_path.open(newline="") as fh:
+        for row in csv.DictReader(fh):
+            key = tuple(row[column] for column in COLUMNS[:-1])
+            table[key] = float(row["value"]) if row["value"] else None
+    return table
+
+
+def stored_value(value):
+    return value
+
+
+def table_metrics(result_list: List[ResultWithMetadata], problem_mod, table):
+    """
+    Same metrics as `metrics_processor.yield_metrics`, served from the table. Results
+    missing from the table (e.g. added after the build) fall back to computing.
+    """
+    for metric_name, metric_name_long, data_process in metrics_processor.yield_metrics(
+        result_list, problem_mod
+    ):
+        thunks = []
+        for result, thunk in zip(result_list, data_process):
+            key = table_key(result, metric_name)
+            thunks.append(partial(stored_value, table[key]) if key in table else thunk)
+        yield metric_name, metric_name_long, thunks
@@ -2,6 +2,10 @@ import random
 from datetime import datetime
 from typing import List
 
+SIMULATION_ID_PATTERN = (
+    r"(?P<rundate>\d{4}-\d{2}-\d{2}\.\d{2}\d{2}\d{2}\.\d{6})__(?P<runid>\d{7})"
+)
+
 
 def get_simulation_id(run_id, run_date=None):
     run_date = run_date if run_date else datetime.today().strftime("%Y-%m-%d.%H%M%S.%f")
@@ -2,10 +2,10 @@ import collections
 import logging
 import operator
 import random
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 
-import rx
-from rx import operators as ops
 from thespian.actors import ActorSystem
 
 from evotools import rxtools
@@ -15,7 +15,6 @@ from simulation.timing import system_time
 
 logger = logging.getLogger(__name__)
 
-
 def run_parallel(args):
     worker_factory, simulation_cases = factory.resolve_configuration(args)
 
@@ -29,33 +28,87 @@ def run_parallel(args):
 
     wall_time = []
     start_time = datetime.now()
-    results = []
+    results = [None] * len(simulation_cases)
     logger.debug("Simulation cases: %s", simulation_cases)
     logger.debug("Work will be divided into %d processes", processes_no)
 
     sys = ActorSystem("multiprocTCPBase", logDefs=log_helper.EVOGIL_LOG_CONFIG)
 
     with log_time(system_time, logger, "Pool evaluated in {time_res}s", out=wall_time):
-
-        def process_result(subres):
-            results.append(subres)
-            log_simulation_stats(start_time, subres[-1], len(simulation_cases))
-
-        rx.from_iterable(range(len(simulation_cases))).pipe(
-            ops.map(lambda i: worker_factory(simulation_cases[i], i)),
-            # ops.map(lambda w: rxtools.from_process(w.run)),
-            ops.map(lambda w : w.run()),
-            # ops.merge(max_concurrent=1)
-            ops.do_action(on_next=process_result)
-        ).run()
+        workers = [
+            worker_factory(simulation_case, i)
+            for i, simulation_case in enumerate(simulation_cases)
+        ]
+        for finished, (simulation_no, subres) in enumerate(
+            execute_workers(workers, processes_no), start=1
+        ):
+            results[simulation_no] = subres
+            log_simulation_stats(start_time, finished, len(simulation_cases))
     log_summary(args, results, simulation_cases, wall_time)
     rxtools.shutdown_default_executor()
     sys.shutdown()
 
-def log_simulation_stats(start_time, simulation_id, simultations_count):
+
+def execute_workers(workers, processes_no):
+    """
+    Runs `worker.run` of every worker in the default process executor, keeping at most
+    `processes_no` of them in flight, and yields `(simulation_no, result)` pairs in the
+    order of completion. When a worker kills its process, the whole pool breaks: the pool
+    is restarted and every job that was in flight is re-run alone, so only the one that
+    crashes again is reported with a None result.
+    """
+    pending = collections.deque(range(len(workers)))
+    suspects = collections.deque()
+    running = {}
+    isolated = None
+
+    while pending or suspects or running:
+        if suspects:
+            if not running:
+                isolated = suspects.popleft()
+                future = rxtools.default_process_executor.submit(workers[isolated].run)
+                running[future] = isolated
+        else:
+            while pending and len(running) < processes_no:
+                simulation_no = pending.popleft()
+                future = rxtools.default_process_executor.submit(
+                    workers[simulation_no].run
+                )
+                running[future] = simulation_no
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        pool_broken = False
+        for future in done:
+            simulation_no = running.pop(future)
+            try:
+                yield simulation_no, future.result()
+            except BrokenProcessPool:
+                pool_broken = True
+                if simulation_no == isolated:
+                    logger.error("Worker crashed: %s", workers[simulation_no].simulation)
+                    yield simulation_no, None
+                else:
+                    suspects.append(simulation_no)
+            except Exception as e:
+                logger.exception(
+                    "Worker failed: %s", workers[simulation_no].simulation, exc_info=e
+                )
+                yield simulation_no, None
+            if simulation_no == isolated:
+                isolated = None
+
+        if pool_broken:
+            logger.warning("Process pool broken, restarting it")
+            suspects.extend(running.values())
+            running.clear()
+            rxtools.default_process_executor.shutdown(wait=False)
+            rxtools.configure_default_executor(processes_no)
+
+
+def log_simulation_stats(start_time, finished_no, simultations_count):
     current_time = datetime.now()
     diff_time = current_time - start_time
-    ratio = simulation_id * 1.0 / simultations_count
+    ratio = finished_no * 1.0 / simultations_count
     try:
         est_delivery_time = start_time + diff_time / ratio
         time_to_delivery = est_delivery_time - current_time
@@ -63,7 +116,7 @@ def log_simulation_stats(start_time, simulation_id, simultations_count):
             "Job queue progress: %.3f%%. Est. finish in %02d:%02d:%02d (at %s)",
             ratio * 100,
             time_to_delivery.days * 24 + time_to_delivery.seconds // 3600,
-            time_to_delivery.seconds // 60,
+            time_to_delivery.seconds % 3600 // 60,
             time_to_delivery.seconds % 60,
             est_delivery_time.strftime("%Y-%m-%d %H:%M:%S.%f"),
         )
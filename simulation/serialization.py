@@ -4,7 +4,7 @@ from contextlib import suppress
 from importlib import import_module
 from pathlib import Path
 
-from simulation import model, metrics_processor
+from simulation import columnar, model, metrics_processor, metrics_table
 from simulation.model import SimulationCase
 from simulation.serializer import Serializer, ResultWithMetadata
 
@@ -21,13 +21,12 @@ class ResultsExtractor:
 
     def _each_run(self, algo, problem, results_path="results"):
         rootpath = Path(results_path, problem, algo)
+        candidates = {candidate.name for candidate in rootpath.iterdir()}
+        candidates |= columnar.ColumnarStore(rootpath).simulation_ids()
         run_no = 0
-        for candidate in sorted(rootpath.iterdir()):
+        for candidate in sorted(candidates):
             try:
-                match = re.fullmatch(
-                    "(?P<rundate>\d{4}-\d{2}-\d{2}\.\d{2}\d{2}\d{2}\.\d{6})__(?P<runid>\d{7})",
-                    candidate.name,
-                )
+                match = re.fullmatch(model.SIMULATION_ID_PATTERN, candidate)
                 matchdict = match.groupdict()
                 run_id = matchdict["runid"]
                 run_date = matchdict["rundate"]
@@ -48,6 +47,8 @@ class ResultsExtractor:
 class NumberMeasuredResultExtractor(ResultsExtractor):
     def __init__(self, property_name):
         self.property_name = property_name
+        self.shard_path = None
+        self.shard = {}
 
     def load_result(self, runs):
         by_number = defaultdict(list)
@@ -62,12 +63,24 @@ class NumberMeasuredResultExtractor(ResultsExtractor):
     def load_number_measured_results(self, simulation_case, run_no):
         numbers = []
         serializer = Serializer(simulation_case)
+        names = set()
+        for (simulation_id, name), result in sorted(
+            self._load_shard(serializer.path.parent).items()
+        ):
+            if simulation_id == simulation_case.id and re.fullmatch("[0-9]+", name):
+                res = ResultWithMetadata(
+                    result, serializer.get_result_path(name), run_no, simulation_case
+                )
+                numbers.append(res)
+                names.add(name)
         with suppress(FileNotFoundError):
             for candidate in sorted(serializer.path.iterdir()):
                 try:
                     match = re.fullmatch(f"(?P<{self.property_name}>[0-9]+)\.pickle", candidate.name)
 
                     number = int(match.groupdict()[self.property_name])
+                    if str(number) in names:
+                        continue
                     population_pickle = serializer.load(number)
 
                     res = ResultWithMetadata(
@@ -78,6 +91,13 @@ class NumberMeasuredResultExtractor(ResultsExtractor):
                     pass
         return numbers
 
+    def _load_shard(self, store_path):
+        """ The shard of an algorithm is read once for all its runs. """
+        if store_path != self.shard_path:
+            self.shard = columnar.ColumnarStore(store_path).load_all()
+            self.shard_path = store_path
+        return self.shard
+
 
 class BudgetResultsExtractor(NumberMeasuredResultExtractor):
     def __init__(self):
@@ -89,7 +109,16 @@ class TimeResultsExtractor(NumberMeasuredResultExtractor):
         super().__init__("time")
 
 
-def each_result(result_extractor: ResultsExtractor, results_path=RESULTS_DIR):
+def each_result(
+    result_extractor: ResultsExtractor, results_path=RESULTS_DIR, use_metrics_table=True
+):
+    table = metrics_table.load(results_path) if use_metrics_table else None
+
+    def analysis(results, problem_mod):
+        if table is None:
+            return metrics_processor.yield_metrics(results, problem_mod)
+        return metrics_table.table_metrics(results, problem_mod, table)
+
     def f_algo(problem_path, algo_path, problem_mod):
         algo_name = algo_path.name
         problem_name = problem_path.name
@@ -100,7 +129,7 @@ def each_result(result_extractor: ResultsExtractor, results_path=RESULTS_DIR):
                 "problem": problem_name,
                 "algo": algo_name,
                 "results": results,
-                "analysis": metrics_processor.yield_metrics(results, problem_mod),
+                "analysis": analysis(results, problem_mod),
                 **config,
             }
 
@@ -111,6 +140,8 @@ def each_result(result_extractor: ResultsExtractor, results_path=RESULTS_DIR):
 
     with suppress(FileNotFoundError):
         for problem in Path(results_path).iterdir():
+            if not problem.is_dir():
+                continue
             problem_mod = ".".join(["problems", problem.name, "problem"])
             problem_mod = import_module(problem_mod)
             yield problem.name, problem_mod, f_problem(problem, problem_mod)
@@ -9,10 +9,10 @@ from rx import operators as ops
 
 from algorithms.base.driver import BudgetRun, Driver, TimeRun
 from algorithms.base.model import TimeProgressMessage
-from simulation import factory, log_helper
+from simulation import columnar, factory, log_helper
 from simulation.model import SimulationCase
 from simulation.run_config import NotViableConfiguration
-from simulation.serializer import Serializer, Result
+from simulation.serializer import Result
 from simulation.timing import log_time, process_time
 
 
@@ -109,7 +109,7 @@ class BudgetWorker(SimulationWorker):
     def run_driver(
         self, driver: Driver, problem_mod: ModuleType, logger: logging.Logger
     ):
-        serializer = Serializer(self.simulation)
+        serializer = columnar.create_serializer(self.simulation)
         results = []
 
         def process_results(budget: int):
@@ -150,7 +150,7 @@ class TimeWorker(SimulationWorker):
         timeout = self.simulation.params[factory.TIMEOUT_PARAM]
         sampling_interval = self.simulation.params[factory.SAMPLING_INTERVAL_PARAM]
 
-        serializer = Serializer(self.simulation)
+        serializer = columnar.create_serializer(self.simulation)
 
         slots_filled = set()
 
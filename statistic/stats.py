@@ -3,7 +3,7 @@ import multiprocessing
 from itertools import repeat
 
 from evotools.random_tools import close_and_join
-from simulation import serialization
+from simulation import metrics_table, serialization
 from simulation.serialization import BudgetResultsExtractor
 from simulation.timing import process_time, log_time
 from statistic.stats_bootstrap import yield_analysis, average
@@ -53,6 +53,38 @@ def force_data(args):
     return metric_name, metric_name_long, data_process, force_analysis
 
 
+def force_metric_rows(args):
+    results, metric_name, data_process = args
+    values = [x() for x in data_process]
+    return list(metrics_table.table_rows(results, metric_name, values))
+
+
+def each_metric(results_dir):
+    for problem_name, problem_mod, algorithms in serialization.each_result(
+        BudgetResultsExtractor(), results_dir, use_metrics_table=False
+    ):
+        for algo_name, budgets in algorithms:
+            for result in budgets:
+                for metric_name, _, data_process in result["analysis"]:
+                    yield result["results"], metric_name, data_process
+
+
+def build_metrics(args):
+    logger = logging.getLogger(__name__)
+    results_dir = args["--dir"]
+
+    rows = []
+    with log_time(process_time, logger, "Metrics computed in {time_res:.3f}s"):
+        with close_and_join(multiprocessing.Pool(min(int(args["-j"]), 8))) as p:
+            for metric_rows in p.imap(
+                force_metric_rows, each_metric(results_dir), chunksize=1
+            ):
+                rows.extend(metric_rows)
+
+    table_path = metrics_table.save(results_dir, rows)
+    print("Saved {} metric values to {}".format(len(rows), table_path))
+
+
 def statistics(args):
     logger = logging.getLogger(__name__)
 
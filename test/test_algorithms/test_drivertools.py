@@ -0,0 +1,76 @@
+import random
+import unittest
+
+import numpy as np
+
+from algorithms.base import drivertools
+
+DIMS = [(0.0, 1.0), (-5.0, 5.0), (0.0, 1.0)]
+SAMPLES = 20000
+
+
+class BatchOperatorsTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(42)
+        self.rng = drivertools.make_rng()
+
+    def assertSameDistribution(self, scalar, batch):
+        np.testing.assert_allclose(scalar.mean(axis=0), batch.mean(axis=0), atol=0.05)
+        np.testing.assert_allclose(scalar.std(axis=0), batch.std(axis=0), atol=0.05)
+
+    def assertWithinBounds(self, xs):
+        lower, upper = np.array(DIMS).T
+        self.assertTrue(np.all(xs >= lower))
+        self.assertTrue(np.all(xs <= upper))
+
+    def test_mutation_matches_scalar_operator(self):
+        x = [0.1, 3.0, 0.9]
+        scalar = np.array(
+            [drivertools.mutate(x, DIMS, 0.5, 20.0) for _ in range(SAMPLES)]
+        )
+        batch = drivertools.mutate_batch([x] * SAMPLES, DIMS, 0.5, 20.0, self.rng)
+
+        self.assertEqual((SAMPLES, len(DIMS)), batch.shape)
+        self.assertWithinBounds(batch)
+        self.assertSameDistribution(scalar, batch)
+        np.testing.assert_allclose(
+            (scalar != x).mean(axis=0), (batch != x).mean(axis=0), atol=0.02
+        )
+
+    def test_crossover_matches_scalar_operator(self):
+        xs, ys = [0.2, -4.0, 0.5], [0.7, 4.0, 0.5]
+        scalar = np.array(
+            [drivertools.crossover(xs, ys, DIMS, 0.9, 15.0) for _ in range(SAMPLES)]
+        )
+        batch = drivertools.crossover_batch(
+            [xs, ys], [0] * SAMPLES, [1] * SAMPLES, DIMS, 0.9, 15.0, self.rng
+        )
+
+        self.assertEqual((SAMPLES, len(DIMS)), batch.shape)
+        self.assertWithinBounds(batch)
+        self.assertSameDistribution(scalar, batch)
+        self.assertTrue(np.all(batch[:, 2] == 0.5))
+
+    def test_sbx_keeps_parents_of_pairs_not_crossed(self):
+        parents_a = np.array([[0.2, -4.0, 0.5]] * 100)
+        parents_b = np.array([[0.7, 4.0, 0.1]] * 100)
+
+        children_a, children_b, crossed = drivertools.sbx_batch(
+            parents_a, parents_b, DIMS, 0.5, 15.0, self.rng
+        )
+
+        self.assertTrue(crossed.any() and not crossed.all())
+        np.testing.assert_array_equal(parents_a[~crossed], children_a[~crossed])
+        np.testing.assert_array_equal(parents_b[~crossed], children_b[~crossed])
+
+    def test_rng_follows_random_seed(self):
+        random.seed(7)
+        first = drivertools.mutate_batch(
+            [[0.5, 0.0, 0.5]], DIMS, 1.0, 20.0, drivertools.make_rng()
+        )
+        random.seed(7)
+        second = drivertools.mutate_batch(
+            [[0.5, 0.0, 0.5]], DIMS, 1.0, 20.0, drivertools.make_rng()
+        )
+
+        np.testing.assert_array_equal(first, second)
@@ -0,0 +1,56 @@
+import random
+import sys
+import unittest
+
+import floatextras
+import numpy as np
+
+from algorithms.HGS import tools
+
+
+def reference_trim(value, bits_no):
+    sign, digits, exponent = floatextras.as_tuple(value)
+    digits = tuple([(d if i < bits_no else 0) for i, d in enumerate(digits)])
+    return floatextras.from_tuple((sign, digits, exponent))
+
+
+class TrimMantissaTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.values = [
+            0.0,
+            -0.0,
+            1.0,
+            -3.5,
+            5e-324,
+            1e-310,
+            sys.float_info.max,
+            float("inf"),
+            -float("inf"),
+        ] + [random.uniform(-100.0, 100.0) for _ in range(200)]
+
+    def test_same_values_as_tuple_conversion(self):
+        for bits_no in [-1, 0, 1, 4, 16, 51, 52, 64]:
+            with self.subTest(bits_no=bits_no):
+                expected = [reference_trim(x, bits_no) for x in self.values]
+                trimmed = tools.trim_vector(self.values, bits_no)
+                self.assertEqual(
+                    np.array(expected).view(np.uint64).tolist(),
+                    np.array(trimmed).view(np.uint64).tolist(),
+                )
+                self.assertEqual(
+                    expected[-1], tools.trim_mantissa(self.values[-1], bits_no)
+                )
+
+    def test_trim_array_keeps_shape_and_input(self):
+        xs = np.array([self.values[-6:], self.values[-12:-6]])
+        original = xs.copy()
+
+        trimmed = tools.trim_array(xs, 4)
+
+        self.assertEqual(xs.shape, trimmed.shape)
+        np.testing.assert_array_equal(original, xs)
+        np.testing.assert_array_equal(tools.trim_array(trimmed, 4), trimmed)
+
+    def test_nan_stays_nan(self):
+        self.assertTrue(np.isnan(tools.trim_mantissa(float("nan"), 4)))
@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from algorithms.base.hv import HyperVolume
+from evotools import nd_sort
+
+
+def random_front(dims, size):
+    if size == 0:
+        return []
+    points = [
+        [round(random.uniform(0.0, 1.2), 3) for _ in range(dims)] for _ in range(size)
+    ]
+    front = [points[i] for i in nd_sort.non_dominated_fronts(points)[0]]
+    return front + random.sample(front, min(3, len(front)))
+
+
+class HyperVolumeBackendTest(unittest.TestCase):
+    def test_fast_backends_match_recursion(self):
+        random.seed(0)
+        for dims in [2, 3]:
+            reference_point = [1.0] * dims
+            for size in [0, 1, 2, 10, 100]:
+                for _ in range(10):
+                    with self.subTest(dims=dims, size=size):
+                        front = random_front(dims, size)
+                        expected = HyperVolume(
+                            reference_point, backend="recursive"
+                        ).compute(front)
+
+                        result = HyperVolume(reference_point).compute(front)
+
+                        self.assertAlmostEqual(expected, result, places=12)
+
+    def test_shifted_reference_point(self):
+        random.seed(1)
+        for dims in [2, 3]:
+            reference_point = [50.0] * dims
+            front = [[x * 40 - 5 for x in p] for p in random_front(dims, 50)]
+            self.assertAlmostEqual(
+                HyperVolume(reference_point, backend="recursive").compute(front),
+                HyperVolume(reference_point).compute(front),
+                places=6,
+            )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            HyperVolume([1.0, 1.0], backend="magic")
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from algorithms.base.population import Population
+
+
+class PopulationTest(unittest.TestCase):
+    def setUp(self):
+        self.population = Population.from_vectors([[0.0, 1.0], [2.0, 3.0]], 2)
+        self.population.objectives[:] = [[1.0, 2.0], [0.5, 1.0]]
+
+    def test_vectors_round_trip(self):
+        self.assertEqual([[0.0, 1.0], [2.0, 3.0]], self.population.vectors())
+        self.assertEqual(0, len(Population.from_vectors([], 2).vectors()))
+
+    def test_extend_adds_not_evaluated(self):
+        self.population.extend([[4.0, 5.0]])
+
+        self.assertEqual(3, len(self.population))
+        self.assertEqual([True, True, False], list(self.population.evaluated))
+
+    def test_concatenate_and_take(self):
+        empty = Population.from_vectors([], 2)
+        union = Population.concatenate(empty, self.population, self.population)
+        union.fitness = np.arange(4.0)
+
+        taken = union.take([3, 0])
+
+        self.assertEqual([[2.0, 3.0], [0.0, 1.0]], taken.vectors())
+        self.assertEqual([3.0, 0.0], list(taken.fitness))
+
+    def test_remove_vectors(self):
+        self.population.extend([[0.0, 1.0]])
+
+        removed = self.population.remove_vectors([[0.0, 1.0], [7.0, 7.0]])
+
+        self.assertEqual([[0.0, 1.0]], removed)
+        self.assertEqual([[2.0, 3.0], [0.0, 1.0]], self.population.vectors())
+
+    def test_dominance_and_distances(self):
+        self.assertEqual(
+            [[False, False], [True, False]],
+            self.population.dominance_matrix().tolist(),
+        )
+        np.testing.assert_allclose(
+            [[0.0, np.sqrt(1.25)], [np.sqrt(1.25), 0.0]],
+            self.population.objective_distances(),
+        )
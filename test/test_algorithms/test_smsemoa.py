@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from algorithms.SMSEMOA.SMSEMOA import sort_into_fronts
+from algorithms.base.hv import HyperVolume
+from algorithms.base.hv_contribution import exclusive_contributions
+from evotools import nd_sort
+from simulation.factory import prepare
+
+
+class HypervolumeContributionTest(unittest.TestCase):
+    def test_matches_leave_one_out(self):
+        random.seed(0)
+        for dims in [2, 3, 4]:
+            reference_point = [1.0] * dims
+            hv = HyperVolume(reference_point)
+            for _ in range(20):
+                points = [
+                    [round(random.uniform(0.0, 1.2), 2) for _ in range(dims)]
+                    for _ in range(25)
+                ]
+                front = [points[i] for i in nd_sort.non_dominated_fronts(points)[0]]
+                front.append(front[0])
+                full = hv.compute(front)
+                expected = [
+                    full - hv.compute(front[:i] + front[i + 1 :])
+                    for i in range(len(front))
+                ]
+
+                contributions = exclusive_contributions(front, reference_point)
+
+                for a, b in zip(expected, contributions):
+                    self.assertAlmostEqual(a, b, places=12)
+
+
+class SMSEMOAFrontsTest(unittest.TestCase):
+    def test_incremental_fronts_match_full_sort(self):
+        random.seed(1)
+        driver_factory, _ = prepare("SMSEMOA", "ZDT1")
+        driver = driver_factory()
+
+        for _ in range(3):
+            driver.step()
+            expected = sort_into_fronts(driver.individuals)
+            self.assertEqual(
+                [set(map(id, front)) for front in expected],
+                [set(map(id, front)) for front in driver.fronts],
+            )
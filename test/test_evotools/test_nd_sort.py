@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from evotools import nd_sort
+from evotools.ea_utils import dominates
+from metrics import metrics_utils
+
+
+def brute_force_ranks(points):
+    ranks = [None] * len(points)
+    remaining = set(range(len(points)))
+    rank = 0
+    while remaining:
+        front = {
+            i
+            for i in remaining
+            if not any(dominates(points[j], points[i]) for j in remaining)
+        }
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+def brute_force_filter(points):
+    return [p for p in points if not any(dominates(q, p) for q in points)]
+
+
+class NonDominatedSortTest(unittest.TestCase):
+    def random_points(self, n, m):
+        # coarse grid, so that ties and duplicates are frequent
+        points = [[random.randint(0, 6) for _ in range(m)] for _ in range(n)]
+        return points + random.sample(points, n // 10)
+
+    def test_ranks_match_brute_force(self):
+        random.seed(42)
+        for m in [1, 2, 3, 5]:
+            for n in [1, 10, 50, 200]:
+                points = self.random_points(n, m)
+                self.assertEqual(
+                    brute_force_ranks(points),
+                    list(nd_sort.non_dominated_ranks(points)),
+                    "n={}, m={}".format(n, m),
+                )
+
+    def test_fronts_partition_items(self):
+        random.seed(7)
+        points = self.random_points(100, 3)
+        items = ["x{}".format(i) for i in range(len(points))]
+
+        fronts = nd_sort.sort_into_fronts(items, points)
+
+        self.assertCountEqual(items, [x for front in fronts for x in front])
+        ranks = brute_force_ranks(points)
+        for rank, front in enumerate(fronts):
+            for x in front:
+                self.assertEqual(rank, ranks[items.index(x)])
+
+    def test_empty(self):
+        self.assertEqual([], nd_sort.non_dominated_fronts([]))
+
+    def test_grouped_ranks(self):
+        ranks = nd_sort.grouped_ranks([0, 1, 0, 0, 1], [0.5, 0.3, 0.1, 0.5, 0.3])
+        self.assertEqual([1, 0, 0, 1, 0], list(ranks))
+
+    def test_non_dominated_mask_matches_brute_force(self):
+        random.seed(11)
+        for m in [1, 2, 3, 4, 6]:
+            for n in [1, 10, 100, 700]:
+                points = self.random_points(n, m)
+                self.assertEqual(
+                    [rank == 0 for rank in brute_force_ranks(points)],
+                    list(nd_sort.non_dominated_mask(points)),
+                    "n={}, m={}".format(n, m),
+                )
+
+    def test_filter_not_dominated_keeps_order_and_duplicates(self):
+        random.seed(3)
+        for m in [2, 3, 5]:
+            points = [tuple(p) for p in self.random_points(80, m)]
+            self.assertEqual(
+                brute_force_filter(points),
+                metrics_utils.filter_not_dominated(points),
+            )
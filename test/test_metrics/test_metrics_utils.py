@@ -0,0 +1,100 @@
+import math
+import random
+import unittest
+from unittest import mock
+
+from metrics import metrics, metrics_utils
+from metrics.metrics_utils import euclid_distance, euclid_sqr_distance
+
+
+def reference_distance(from_set, to_set):
+    distances = [min(euclid_sqr_distance(f, t) for t in to_set) for f in from_set]
+    return math.sqrt(sum(distances) / len(distances))
+
+
+def reference_spacing(solution):
+    min_distances = []
+    for i, a in enumerate(solution):
+        distances = [
+            sum(math.fabs(x - y) for x, y in zip(a, b))
+            for j, b in enumerate(solution)
+            if i != j
+        ]
+        if distances:
+            min_distances.append(min(distances))
+    mean_dist = sum(min_distances) / len(min_distances) if min_distances else 0
+    dist_sum = sum((mean_dist - dist) ** 2 for dist in min_distances)
+    return math.sqrt(dist_sum / (float(len(solution) - 1) + metrics_utils.EPSILON))
+
+
+def reference_extent(solution):
+    return math.sqrt(
+        sum(
+            max(math.fabs(x[i] - y[i]) for x in solution for y in solution)
+            for i in range(len(solution[0]))
+        )
+    )
+
+
+def reference_distribution(solution, sigma=0.5):
+    return sum(
+        1 for x in solution for y in solution if sigma < euclid_distance(x, y)
+    ) / (len(solution) * (len(solution) - 1))
+
+
+def reference_epsilon(solution, pareto):
+    return max(
+        min(max(p_k - s_k for s_k, p_k in zip(s, p)) for p in pareto)
+        for s in solution
+    )
+
+
+class MetricsUtilsTest(unittest.TestCase):
+    def random_points(self, n, m):
+        points = [[random.uniform(0, 2) for _ in range(m)] for _ in range(n)]
+        return points + random.sample(points, n // 10)
+
+    def cases(self):
+        random.seed(7)
+        for m in [2, 3, 5]:
+            for n in [1, 2, 30, 120]:
+                yield self.random_points(n, m), self.random_points(50, m)
+
+    def assert_metrics_match(self):
+        for solution, pareto in self.cases():
+            self.assertAlmostEqual(
+                reference_distance(solution, pareto),
+                metrics_utils.generational_distance(solution, pareto),
+            )
+            self.assertAlmostEqual(
+                reference_distance(pareto, solution),
+                metrics_utils.inverse_generational_distance(solution, pareto),
+            )
+            self.assertAlmostEqual(
+                reference_spacing(solution), metrics_utils.spacing(solution)
+            )
+            self.assertAlmostEqual(
+                reference_extent(solution), metrics_utils.extent(solution)
+            )
+            self.assertAlmostEqual(
+                reference_epsilon(solution, pareto),
+                metrics.epsilon(solution, solution, pareto),
+            )
+            if len(solution) > 1:
+                self.assertAlmostEqual(
+                    reference_distribution(solution),
+                    metrics_utils.distribution(solution),
+                )
+
+    def test_metrics_match_reference(self):
+        self.assert_metrics_match()
+
+    def test_metrics_match_reference_in_small_blocks(self):
+        with mock.patch.object(metrics_utils, "BLOCK_CELLS", 64):
+            self.assert_metrics_match()
+
+    def test_spacing_counts_duplicates(self):
+        self.assertAlmostEqual(
+            reference_spacing([[0, 0], [0, 0], [1, 3]]),
+            metrics_utils.spacing([[0, 0], [0, 0], [1, 3]]),
+        )
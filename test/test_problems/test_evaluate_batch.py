@@ -0,0 +1,27 @@
+import random
+import unittest
+from importlib import import_module
+
+import numpy as np
+
+PROBLEMS = ["ZDT1", "ZDT2", "ZDT3", "ZDT4", "ZDT6"] + [
+    "UF{}".format(i) for i in range(1, 13)
+]
+
+
+class EvaluateBatchTest(unittest.TestCase):
+    def test_batch_matches_scalar_fitnesses(self):
+        random.seed(0)
+        for name in PROBLEMS:
+            with self.subTest(problem=name):
+                problem_mod = import_module("problems.{}.problem".format(name))
+                xs = [
+                    [random.uniform(lo, hi) for lo, hi in problem_mod.dims]
+                    for _ in range(20)
+                ]
+                expected = [[f(x) for f in problem_mod.fitnesses] for x in xs]
+
+                result = problem_mod.evaluate_batch(np.array(xs))
+
+                self.assertEqual((len(xs), len(problem_mod.fitnesses)), result.shape)
+                np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from simulation import columnar
+from simulation.model import SimulationCase
+from simulation.serialization import BudgetResultsExtractor
+from simulation.serializer import Result, Serializer
+
+
+def simulation_case(results_dir, run_id, results_format):
+    return SimulationCase(
+        "ZDT1",
+        "NSGAII",
+        run_id,
+        None,
+        results_dir,
+        **{columnar.RESULTS_FORMAT_PARAM: results_format}
+    )
+
+
+class ColumnarStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        case = simulation_case(self.results_dir, 1, columnar.COLUMNAR_FORMAT)
+        serializer = columnar.create_serializer(case)
+        result = Result([[0.1, 0.2], [0.3, 0.4]], [[1.0, 2.0], [3.0, 0.5]], cost=20)
+
+        serializer.store(result, "20")
+        loaded = serializer.load("20")
+
+        self.assertEqual(result.population, loaded.population)
+        self.assertEqual(result.fitnesses, loaded.fitnesses)
+        self.assertEqual({"cost": 20}, loaded.additional_data)
+
+    def test_identical_blocks_stored_once(self):
+        store = columnar.ColumnarStore(Path(self.results_dir, "ZDT1", "NSGAII"))
+        result = Result([[0.1, 0.2]], [[1.0, 2.0]], cost=10)
+
+        store.append("a", "10", result)
+        store.append("b", "10", Result([[0.1, 0.2]], [[1.0, 2.0]], cost=11))
+
+        self.assertEqual(4 * columnar.DTYPE.itemsize, store.data_path.stat().st_size)
+        loaded = store.load_all()
+        self.assertEqual({("a", "10"), ("b", "10")}, set(loaded))
+        self.assertEqual({"cost": 11}, loaded[("b", "10")].additional_data)
+
+    def test_extractor_reads_both_formats(self):
+        for run_id, results_format in [
+            (1, columnar.PICKLE_FORMAT),
+            (2, columnar.COLUMNAR_FORMAT),
+        ]:
+            case = simulation_case(self.results_dir, run_id, results_format)
+            serializer = columnar.create_serializer(case)
+            for budget in [10, 20]:
+                serializer.store(
+                    Result([[run_id, budget]], [[budget, run_id]], cost=budget),
+                    str(budget),
+                )
+        self.assertIsInstance(
+            columnar.create_serializer(
+                simulation_case(self.results_dir, 3, columnar.PICKLE_FORMAT)
+            ),
+            Serializer,
+        )
+
+        loaded = BudgetResultsExtractor().load("NSGAII", "ZDT1", self.results_dir)
+
+        self.assertEqual([10, 20], [config["budget"] for _, config in loaded])
+        for results, config in loaded:
+            self.assertEqual([0, 1], sorted(result.run_no for result in results))
+            self.assertEqual(
+                {1, 2}, {result.population[0][0] for result in results}
+            )
+            for result in results:
+                self.assertEqual(str(config["budget"]), result.name)
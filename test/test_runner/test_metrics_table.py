@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from problems.ZDT1 import problem
+from simulation import metrics_table
+from simulation.model import SimulationCase
+from simulation.serializer import Result, ResultWithMetadata
+
+
+def result_with_metadata(results_dir, run_id, budget):
+    case = SimulationCase("ZDT1", "NSGAII", run_id, None, results_dir)
+    path = Path(results_dir, "ZDT1", "NSGAII", case.id, "{}.pickle".format(budget))
+    result = Result([[0.5] * 30], [[0.5, 0.8]], cost=budget)
+    return ResultWithMetadata(result, path, run_id, case)
+
+
+class MetricsTableTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results_dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_table(self):
+        self.assertIsNone(metrics_table.load(self.results_dir))
+
+    def test_round_trip(self):
+        results = [result_with_metadata(self.results_dir, i, 10) for i in range(2)]
+        rows = list(metrics_table.table_rows(results, "gd", [0.25, None]))
+
+        metrics_table.save(self.results_dir, rows)
+        table = metrics_table.load(self.results_dir)
+
+        self.assertEqual(
+            [0.25, None],
+            [table[metrics_table.table_key(r, "gd")] for r in results],
+        )
+
+    def test_table_values_with_fallback(self):
+        stored, missing = [
+            result_with_metadata(self.results_dir, i, 10) for i in range(2)
+        ]
+        table = {metrics_table.table_key(stored, "cost"): 123.0}
+
+        analysis = {
+            metric_name: [x() for x in data_process]
+            for metric_name, _, data_process in metrics_table.table_metrics(
+                [stored, missing], problem, table
+            )
+            if metric_name == "cost"
+        }
+
+        self.assertEqual({"cost": [123.0, 10.0]}, analysis)
@@ -0,0 +1,44 @@
+import os
+import unittest
+
+from evotools import rxtools
+from simulation.run_parallel import execute_workers
+
+
+class DummyWorker:
+    def __init__(self, simulation_no, crash=False):
+        self.simulation = simulation_no
+        self.simulation_no = simulation_no
+        self.crash = crash
+
+    def run(self):
+        if self.crash:
+            os._exit(1)
+        return [], 0.0, self.simulation_no
+
+
+class ExecuteWorkersTest(unittest.TestCase):
+    def setUp(self):
+        rxtools.configure_default_executor(2)
+
+    def tearDown(self):
+        rxtools.shutdown_default_executor()
+
+    def test_all_results_streamed(self):
+        workers = [DummyWorker(i) for i in range(6)]
+
+        results = dict(execute_workers(workers, 2))
+
+        self.assertEqual(set(range(6)), set(results))
+        for simulation_no, result in results.items():
+            self.assertEqual(simulation_no, result[-1])
+
+    def test_crashed_worker_does_not_stop_others(self):
+        workers = [DummyWorker(i, crash=(i == 2)) for i in range(5)]
+
+        results = dict(execute_workers(workers, 2))
+
+        self.assertEqual(set(range(5)), set(results))
+        self.assertIsNone(results[2])
+        for simulation_no in [0, 1, 3, 4]:
+            self.assertEqual(simulation_no, results[simulation_no][-1])